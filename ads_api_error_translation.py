@@ -13,6 +13,19 @@
 # limitations under the License.
 """Provides functionality to translate ads api errors to more readable."""
 
+_TRANSLATIONS = {
+    'Cannot use empty field mask in update operation.': (
+        'Failed to replace asset. e.g. Cannot find the asset to be replaced.'
+    ),
+    'Too many.': 'Too many. The AdGroup has no space for this asset. ',
+    'Too short.': 'YouTube id is too short.',
+    'Too long.': 'Asset name is too long.',
+    'The error code is not in this version.': (
+        'Please check if there is policy issues in the campaign or '
+        'adgroup.(e.g. disapproved assets)'
+    ),
+}
+
 
 def translate_ads_api_errors(error):
   """Makes Google Ads API errors more readable.
@@ -23,18 +36,37 @@ def translate_ads_api_errors(error):
   Returns:
     Translation of Google Ads APIs errors.
   """
-  if error == 'Cannot use empty field mask in update operation.':
-    return ('Failed to replace asset. e.g. Cannot find the asset to be '
-            'replaced.')
-  elif error == 'Too many.':
-    return ('Too many. The AdGroup has no space for this asset. ')
-  elif error == 'Too short.':
-    return ('YouTube id is too short.')
-  elif error == 'Too long.':
-    return ('Asset name is too long.')
-  elif error == 'The error code is not in this version.':
-    return (
-        'Please check if there is policy issues in the campaign or '
-        'adgroup.(e.g. disapproved assets)'
-    )
-  return error
+  if not isinstance(error, str):
+    return error
+  return _TRANSLATIONS.get(error, error)
+
+
+def translate_ads_api_errors_batch(errors):
+  """Makes a list of Google Ads API errors more readable.
+
+  Args:
+    errors: iterable of Google Ads APIs errors.
+
+  Returns:
+    List of translations, in the same order as the given errors.
+  """
+  get_translation = _TRANSLATIONS.get
+  return [
+      get_translation(error, error) if isinstance(error, str) else error
+      for error in errors
+  ]
+
+
+def get_error_message(errors, separator=''):
+  """Concatenates multiple Google Ads API error messages into one.
+
+  Args:
+    errors: iterable of Google Ads API errors to be concatenated after
+      translation.
+    separator: string placed between the translated messages.
+
+  Returns:
+    error_message: Concatenated message.
+  """
+  return separator.join(
+      translate_ads_api_errors_batch(error.message for error in errors))
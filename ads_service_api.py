@@ -13,17 +13,169 @@
 # limitations under the License.
 """Provides functionality to interact with Google Ads platform."""
 
+import collections
+from concurrent import futures
+import contextlib
 from hashlib import md5
-import io
+import itertools
+import logging
+import operator
 import requests
+from requests import adapters
+from urllib3.util import retry
 import datetime
+import functools
 import re
-import copy
+import sqlite3
+import threading
+import time
 
 from google.api_core import protobuf_helpers
 from google.ads import googleads
 
+_LOGGER = logging.getLogger(__name__)
 _TODAY = datetime.datetime.today()
+_IMAGE_DOWNLOAD_POOL_SIZE = 16
+_IMAGE_DOWNLOAD_TIMEOUT_SECONDS = 30
+_IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Image downloads are retried on connection errors and on these transient
+# HTTP statuses, with exponential backoff.
+_IMAGE_DOWNLOAD_RETRIES = 3
+_IMAGE_DOWNLOAD_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_MAX_QUERY_WORKERS = 8
+_AD_GROUP_AD_ID_CHUNK_SIZE = 200
+# GAQL query templates. Only the fields read from the results are selected.
+_TEXT_ASSET_VALUE_QUERY = (
+    'SELECT asset.text_asset.text '
+    'FROM asset '
+    'WHERE asset.resource_name = {asset_id} '
+    'LIMIT 1')
+_ASSET_PERFORMANCE_BY_METRICS_QUERY = (
+    'SELECT '
+    'ad_group.id, '
+    'ad_group_ad_asset_view.asset, '
+    'ad_group_ad_asset_view.performance_label, '
+    'asset.text_asset.text, '
+    'metrics.impressions, '
+    'metrics.conversions, '
+    'metrics.conversions_value, '
+    'metrics.ctr, '
+    'metrics.clicks '
+    'FROM ad_group_ad_asset_view '
+    'WHERE ad_group.id IN ({ad_group_ids}) '
+    'AND segments.date BETWEEN "{start_date}" AND "{end_date}" '
+    'AND ad_group_ad_asset_view.field_type = "{field_type}" '
+    'AND ad_group_ad_asset_view.enabled = True '
+    'AND ad_group_ad_asset_view.performance_label IN ("LOW", "GOOD", "BEST") '
+    'AND {asset_id_field} IN ({asset_ids})')
+# Upper bound of Google Ads API calls started per second by one AdService.
+_MAX_ADS_API_CALLS_PER_SECOND = 20
+_CUSTOMER_RESOURCE_NAME_PATTERN = re.compile(r'customers/(\d+)')
+# Repeated asset field of each asset type, by the ad field of an ad group ad.
+_AD_ASSET_FIELDS = {
+    'app_ad': {
+        'DESCRIPTION': 'descriptions',
+        'HEADLINE': 'headlines',
+        'VIDEO': 'youtube_videos',
+        'IMAGE': 'images',
+    },
+    'app_engagement_ad': {
+        'DESCRIPTION': 'descriptions',
+        'HEADLINE': 'headlines',
+        'VIDEO': 'videos',
+        'IMAGE': 'images',
+    },
+}
+_AD_ASSET_GETTERS = {
+    ad_field: tuple(
+        (asset_type,
+         operator.attrgetter(f'ad_group_ad.ad.{ad_field}.{asset_field}'))
+        for asset_type, asset_field in asset_fields.items())
+    for ad_field, asset_fields in _AD_ASSET_FIELDS.items()
+}
+# Performance of an asset in an ad group, as returned by
+# _get_asset_performance_by_metrics.
+AssetPerformance = collections.namedtuple('AssetPerformance', [
+    'ad_group_id', 'asset_id', 'asset_type', 'performance_label',
+    'impressions', 'conversions', 'conversions_value', 'ctr', 'clicks'
+])
+_AD_MEDIA_ASSET_TYPES = {
+    'IMAGE': 'AdImageAsset',
+    'VIDEO': 'AdVideoAsset',
+}
+# Characters escaped inside GAQL string literals.
+_GAQL_STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"'})
+# Md5 hashes of image assets are kept across runs so unchanged images are not
+# downloaded again.
+_IMAGE_HASH_CACHE_FILE = 'config/image_hash_cache.sqlite3'
+_CREATE_IMAGE_HASH_TABLE_QUERY = (
+    'CREATE TABLE IF NOT EXISTS image_md5_hash ('
+    'customer_id TEXT, resource_name TEXT, url TEXT, md5_hash TEXT, '
+    'PRIMARY KEY (customer_id, resource_name, url))')
+
+
+def _to_gaql_string(value):
+  """Quotes a value as a GAQL string literal.
+
+  Args:
+    value: value to quote, e.g. asset text from a sheet.
+
+  Returns:
+    Double quoted string with backslashes and double quotes escaped.
+  """
+  return f'"{str(value).translate(_GAQL_STRING_ESCAPES)}"'
+
+
+def _to_gaql_string_list(values):
+  """Quotes values as a comma separated list of GAQL string literals.
+
+  Args:
+    values: non-empty iterable of values to quote.
+
+  Returns:
+    Comma separated double quoted strings, e.g. for an IN (...) predicate.
+  """
+  escaped_values = [str(value).translate(_GAQL_STRING_ESCAPES)
+                    for value in values]
+  return '"' + '", "'.join(escaped_values) + '"'
+
+
+@functools.lru_cache(maxsize=8)
+def _get_date_range(duration):
+  """Gets the GAQL date range covering the last duration days.
+
+  Args:
+    duration: number of days to look back, excluding today.
+
+  Returns:
+    A tuple of start date and end date as YYYY-MM-DD strings.
+  """
+  start_date = (_TODAY - datetime.timedelta(days=duration)).date()
+  end_date = (_TODAY - datetime.timedelta(days=1)).date()
+  return (start_date.isoformat(), end_date.isoformat())
+
+
+class _RateLimiter():
+  """Spaces out calls so that at most max_calls_per_second calls start."""
+
+  def __init__(self, max_calls_per_second):
+    """Constructs the _RateLimiter instance.
+
+    Args:
+      max_calls_per_second: maximum number of calls started per second.
+    """
+    self._interval = 1.0 / max_calls_per_second
+    self._lock = threading.Lock()
+    self._next_call_time = time.monotonic()
+
+  def wait(self):
+    """Blocks until the next call is allowed to start."""
+    with self._lock:
+      now = time.monotonic()
+      wait_seconds = self._next_call_time - now
+      self._next_call_time = max(now, self._next_call_time) + self._interval
+    if wait_seconds > 0:
+      time.sleep(wait_seconds)
 
 
 class AdService():
@@ -37,18 +189,58 @@ class AdService():
     """
     self._google_ads_client = googleads.client.GoogleAdsClient.load_from_storage(
         ads_account_file)
+    # get_service builds a new transport on every call, so the services are
+    # created once and shared by all calls (gRPC stubs are thread-safe).
+    self._google_ads_service = self._google_ads_client.get_service(
+        'GoogleAdsService')
+    self._ad_service = self._google_ads_client.get_service('AdService')
+    self._asset_service = self._google_ads_client.get_service('AssetService')
+    self._customer_service = self._google_ads_client.get_service(
+        'CustomerService')
+    self._app_ad_type = self._google_ads_client.enums.AdTypeEnum.APP_AD
+    self._app_engagement_ad_type = (
+        self._google_ads_client.enums.AdTypeEnum.APP_ENGAGEMENT_AD)
+    # get_type returns a new message on every call, so the message classes are
+    # resolved once and instantiated directly.
+    self._ad_text_asset_type = type(
+        self._google_ads_client.get_type('AdTextAsset'))
+    self._ad_media_asset_types = {
+        asset_type: type(self._google_ads_client.get_type(type_name))
+        for asset_type, type_name in _AD_MEDIA_ASSET_TYPES.items()
+    }
+    # Throttles calls on the client side, since calls over the API rate
+    # limits fail with RESOURCE_EXHAUSTED and have to be retried.
+    self._rate_limiter = _RateLimiter(_MAX_ADS_API_CALLS_PER_SECOND)
     self._cache_ad_group_ad = {}
+    self._accessible_customers = None
+    self._performance_label_names = None
+    # Reuses connections across image downloads instead of opening a new
+    # connection for every asset.
+    self._http_session = requests.Session()
+    self._http_session.mount(
+        'https://',
+        adapters.HTTPAdapter(
+            pool_connections=_IMAGE_DOWNLOAD_POOL_SIZE,
+            pool_maxsize=_IMAGE_DOWNLOAD_POOL_SIZE,
+            max_retries=retry.Retry(
+                total=_IMAGE_DOWNLOAD_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=_IMAGE_DOWNLOAD_RETRY_STATUSES)))
     self.prev_image_asset_list = None
     self.prev_customer_id = None
 
   def _list_accessible_customers(self):
     """List all accessible customer resource names.
 
+    The result is fetched once and reused for the lifetime of the instance.
+
     Returns:
       results: list of customer resource names.
     """
-    return self._google_ads_client.get_service(
-        'CustomerService').list_accessible_customers().resource_names
+    if self._accessible_customers is None:
+      self._accessible_customers = list(
+          self._customer_service.list_accessible_customers().resource_names)
+    return self._accessible_customers
 
   def _get_customer_id(self, customer_resource_name):
     """Get customer id from customer resource name.
@@ -59,13 +251,31 @@ class AdService():
     Returns:
       customer_id: customer id.
     """
-    m = re.fullmatch('customers/(\d+)', customer_resource_name)
+    m = _CUSTOMER_RESOURCE_NAME_PATTERN.fullmatch(customer_resource_name)
     if not m:
       raise ValueError(
           f'Unable to match customer resource name {customer_resource_name}.')
 
     return m.group(1)
 
+  def _search(self, customer_id, query):
+    """Runs a GAQL query through a single streaming request.
+
+    Unlike GoogleAdsService.search, which issues one request per result page,
+    search_stream returns every row over one server-streaming call.
+
+    Args:
+      customer_id: customer id.
+      query: GAQL query.
+
+    Returns:
+      A list of GoogleAdsRow.
+    """
+    self._rate_limiter.wait()
+    stream = self._google_ads_service.search_stream(
+        customer_id=str(customer_id), query=query)
+    return [row for batch in stream for row in batch.results]
+
   def _get_all_child_accounts(self, seed_customer_id):
     """Gets all child account customer ids of given Manager account or login
 
@@ -90,28 +300,36 @@ class AdService():
              'AND customer_client.status = "ENABLED" ')
 
     # Performs a breadth-first search to build a Dictionary that maps managers
-    # to their child accounts (customerIdsToChildAccounts).
-    unprocessed_customer_ids = [seed_customer_id]
+    # to their child accounts (customerIdsToChildAccounts). All manager
+    # accounts (MCC) of the same level are queried concurrently.
+    unprocessed_customer_ids = [int(seed_customer_id)]
+    seen_customer_ids = set()
     child_accounts = []
 
-    while unprocessed_customer_ids:
-      customer_id = int(unprocessed_customer_ids.pop(0))  # MCC Account
-      response = self._google_ads_client.get_service('GoogleAdsService').search(
-          customer_id=str(customer_id), query=query)
+    with futures.ThreadPoolExecutor(
+        max_workers=_MAX_QUERY_WORKERS) as executor:
+      while unprocessed_customer_ids:
+        responses = executor.map(self._search, unprocessed_customer_ids,
+                                 itertools.repeat(query))
+        unprocessed_customer_ids = []
 
-      # Iterates over all rows in all pages to get all customer clients under the specified
-      # customer's hierarchy.
-      for googleads_row in response:
-        customer_client = googleads_row.customer_client
+        # Iterates over all rows to get all customer clients under the
+        # specified customers' hierarchy.
+        for response in responses:
+          for googleads_row in response:
+            customer_client = googleads_row.customer_client
 
-        if customer_client.id not in child_accounts:
-          if customer_client.manager:
             # A customer can be managed by multiple managers,
-            # to prevent duplication, we check if it's already in the dict.
-            if customer_client.level == 1:
-              unprocessed_customer_ids.append(customer_client.id)
-          else:
-            child_accounts.append(str(customer_client.id))
+            # to prevent duplication, we check if it's already been seen.
+            if customer_client.id in seen_customer_ids:
+              continue
+            seen_customer_ids.add(customer_client.id)
+
+            if customer_client.manager:
+              if customer_client.level == 1:
+                unprocessed_customer_ids.append(customer_client.id)
+            else:
+              child_accounts.append(str(customer_client.id))
 
     return child_accounts
 
@@ -132,8 +350,7 @@ class AdService():
         '"APP_CAMPAIGN_FOR_ENGAGEMENT") AND campaign.status = "ENABLED" AND '
         'ad_group.status = "ENABLED" ')
 
-    return self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
+    return self._search(customer_id, query)
 
   def _get_ad_group_ad(self, customer_id, ad_group_id):
     """Gets ad_group_ad by customer id and ad group id.
@@ -164,8 +381,7 @@ class AdService():
     query = ('SELECT ad_group.id, ad_group_ad.ad.id, ad_group_ad.ad.type '
              'FROM ad_group_ad ')
 
-    results = self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
+    results = self._search(customer_id, query)
 
     for row in results:
       ad_group_id = str(row.ad_group.id)
@@ -236,7 +452,7 @@ class AdService():
     Raises:
       TypeError: unknown campaign type.
     """
-    if ad_group_ad_type == self._google_ads_client.enums.AdTypeEnum.APP_AD:
+    if ad_group_ad_type == self._app_ad_type:
       if asset_type == 'HEADLINE':
         asset_operation = new_list_of_asset.update.app_ad.headlines
       elif asset_type == 'DESCRIPTION':
@@ -250,7 +466,7 @@ class AdService():
             'Unknown campaign type. Only DESCRIPTION, HEADLINE, IMAGE, VIDEO are allowed.'
         )
 
-    elif ad_group_ad_type == self._google_ads_client.enums.AdTypeEnum.APP_ENGAGEMENT_AD:
+    elif ad_group_ad_type == self._app_engagement_ad_type:
       if asset_type == 'HEADLINE':
         asset_operation = new_list_of_asset.update.app_engagement_ad.headlines
       elif asset_type == 'DESCRIPTION':
@@ -275,20 +491,8 @@ class AdService():
     Args:
       asset_operation: current asset list of an ad.
       asset: text or asset id to append.
-
-    Raises:
-      GoogleAdsException: Google Ads API error.
-      Exception: If unknown error occurs.
     """
-    try:
-      asset_operation.append(asset)
-    except googleads.errors.GoogleAdsException as failures:
-      error_message = ''
-      for error in failures.failure.errors:
-        error_message += error.message
-      print(error_message)
-    except Exception:
-      print('Unknown error occured while uploading the asset to the ad.')
+    asset_operation.append(asset)
 
   def _remove_asset_operation(self, asset_operation, asset):
     """Remove asset from an ad.
@@ -296,25 +500,13 @@ class AdService():
     Args:
       asset_operation: current asset list of an ad.
       asset: text or asset id to remove.
-
-    Raises:
-      GoogleAdsException: Google Ads API error.
-      ValueError: If the asset does not exist in the adgroup.
-      Exception: If unknown error occurs.
     """
     try:
       asset_operation.remove(asset)
-    except googleads.errors.GoogleAdsException as failures:
-      error_message = ''
-      for error in failures.failure.errors:
-        error_message += error.message
-      print(error_message)
     except ValueError:
-      print(
-          'Please check if the asset exists in the adgroup. If not, manually delete from the Time Managed Sheet.'
-      )
-    except Exception:
-      print('Unknown error occured while removing the asset from ad.')
+      _LOGGER.warning(
+          'Please check if the asset exists in the adgroup. If not, manually '
+          'delete from the Time Managed Sheet.')
 
   def _perform_text_asset_operation(self, add_or_remove, asset_type, text,
                                     customer_id, ad_group_id):
@@ -334,7 +526,6 @@ class AdService():
     if not text:
       raise ValueError('Unable to perform text action. Unknown error.')
 
-    service = self._google_ads_client.get_service('AdService')
     ad_group_ad = self._get_ad_group_ad(customer_id, ad_group_id)
 
     if not ad_group_ad:
@@ -344,8 +535,7 @@ class AdService():
     (ad_group_ad_type, ad_group_ad_id) = ad_group_ad
     resource_name = f'customers/{customer_id}/ads/{str(ad_group_ad_id)}'
     new_list_of_asset = self._google_ads_client.get_type('AdOperation')
-    ad_text_asset = self._google_ads_client.get_type('AdTextAsset')
-    ad_text_asset.text = text
+    ad_text_asset = self._ad_text_asset_type(text=text)
 
     asset_operation = self._get_asset_list_by_asset_type(
         asset_type, ad_group_ad_type, new_list_of_asset)
@@ -366,7 +556,9 @@ class AdService():
         new_list_of_asset.update_mask,
         protobuf_helpers.field_mask(None, new_list_of_asset.update._pb))
 
-    service.mutate_ads(customer_id=customer_id, operations=[new_list_of_asset])
+    self._rate_limiter.wait()
+    self._ad_service.mutate_ads(
+        customer_id=customer_id, operations=[new_list_of_asset])
 
   def _create_youtube_asset(self, youtube_video_id, customer_id):
     """Creates YouTube video asset from YouTube video id.
@@ -378,13 +570,13 @@ class AdService():
     Returns:
       YouTube video asset id.
     """
-    asset_service = self._google_ads_client.get_service('AssetService')
     asset_operation = self._google_ads_client.get_type('AssetOperation')
 
     # asset_operation.create.name = youtube_video_id
     asset_operation.create.youtube_video_asset.youtube_video_id = youtube_video_id
 
-    ad_video_asset = asset_service.mutate_assets(
+    self._rate_limiter.wait()
+    ad_video_asset = self._asset_service.mutate_assets(
         customer_id=customer_id, operations=[asset_operation])
 
     return ad_video_asset
@@ -435,6 +627,71 @@ class AdService():
     self._perform_media_asset_operation('REMOVE', 'IMAGE', asset_id,
                                         customer_id, ad_group_id)
 
+  def _remove_assets_from_campaign(self, assets, customer_id, ad_group_id):
+    """Removes several assets from ad group ad with a single mutate.
+
+    Args:
+      assets: list of (asset_type, asset) tuples. asset_type is 'HEADLINE',
+        'DESCRIPTION', 'IMAGE' or 'VIDEO' and asset is the text itself for text
+        assets and the asset id for media assets.
+      customer_id: customer id.
+      ad_group_id: ad group id.
+
+    Raises:
+      ValueError: If the ad group id can't match any ad id.
+      TypeError: Unknown type.
+    """
+    if not assets:
+      return
+
+    ad_group_ad = self._get_ad_group_ad(customer_id, ad_group_id)
+
+    if not ad_group_ad:
+      raise ValueError(f'This {ad_group_id} ad_group does not have ad.'
+                       ' Kindly check if the ad group id is correct.')
+
+    (ad_group_ad_type, ad_group_ad_id) = ad_group_ad
+    resource_name = f'customers/{customer_id}/ads/{str(ad_group_ad_id)}'
+    new_list_of_asset = self._google_ads_client.get_type('AdOperation')
+    response = self._get_asset_by_ad_group_ad_id(customer_id, ad_group_ad_id)
+
+    asset_operations = {}
+    for asset_type, _ in assets:
+      if asset_type in asset_operations:
+        continue
+      asset_operation = self._get_asset_list_by_asset_type(
+          asset_type, ad_group_ad_type, new_list_of_asset)
+      if asset_type in ('HEADLINE', 'DESCRIPTION'):
+        self._insert_existing_text_asset(asset_operation, ad_group_ad_id,
+                                         ad_group_ad_type, asset_type,
+                                         customer_id, response)
+      else:
+        self._insert_existing_media_asset(asset_operation, ad_group_ad_id,
+                                          ad_group_ad_type, asset_type,
+                                          customer_id, response)
+      asset_operations[asset_type] = asset_operation
+
+    # An asset list emptied by the removals is left out of a field mask built
+    # afterwards, so the mask is built from the existing assets.
+    field_mask = protobuf_helpers.field_mask(None, new_list_of_asset.update._pb)
+
+    for asset_type, asset in assets:
+      asset_operation = asset_operations[asset_type]
+      if asset_type in ('HEADLINE', 'DESCRIPTION'):
+        for existing_asset in asset_operation:
+          if existing_asset.text == asset:
+            self._remove_asset_operation(asset_operation, existing_asset)
+            break
+      else:
+        self._remove_asset_operation(
+            asset_operation, self._create_ad_asset_by_id(asset_type, asset))
+
+    new_list_of_asset.update.resource_name = resource_name
+    self._google_ads_client.copy_from(new_list_of_asset.update_mask, field_mask)
+    self._rate_limiter.wait()
+    self._ad_service.mutate_ads(
+        customer_id=customer_id, operations=[new_list_of_asset])
+
   def _create_ad_asset_by_id(self, asset_type, asset_id):
     """Creates ad asset by asset id.
 
@@ -448,17 +705,10 @@ class AdService():
     Raises:
       TypeError: Unknown type.
     """
-    if asset_type == 'IMAGE':
-      ad_asset = self._google_ads_client.get_type('AdImageAsset')
-      ad_asset.asset = asset_id
-
-    elif asset_type == 'VIDEO':
-      ad_asset = self._google_ads_client.get_type('AdVideoAsset')
-      ad_asset.asset = asset_id
-    else:
+    if asset_type not in self._ad_media_asset_types:
       raise TypeError('Unknow asset type. Only IMAGE, VIDEO are allowed.')
 
-    return ad_asset
+    return self._ad_media_asset_types[asset_type](asset=asset_id)
 
   def _perform_media_asset_operation(self, add_or_remove, asset_type, asset_id,
                                      customer_id, ad_group_id):
@@ -479,7 +729,6 @@ class AdService():
         if not asset_id:
             raise ValueError('Unable to perform media action. Unknown error.')
 
-        service = self._google_ads_client.get_service('AdService')
         ad_group_ad = self._get_ad_group_ad(customer_id, ad_group_id)
 
         if not ad_group_ad:
@@ -500,14 +749,17 @@ class AdService():
         self._insert_existing_media_asset(asset_operation, ad_group_ad_id,
                                         ad_group_ad_type, asset_type, customer_id)
 
+        # field_mask returns a new message, so no copy is needed to keep the
+        # mask of the existing assets.
+        prev_field_mask = protobuf_helpers.field_mask(
+            None, new_list_of_asset.update._pb)
+
         if add_or_remove == 'ADD':
             self._append_asset_operation(asset_operation, ad_asset)
         else:
             self._remove_asset_operation(asset_operation, ad_asset)
 
         field_mask = None
-        prev_field_mask = copy.deepcopy(
-            protobuf_helpers.field_mask(None, new_list_of_asset.update._pb))
         # If final asset is empty, field mask will be empty and mutate operation will be skipped. So we need to use prev field mask in that case.
         if not asset_operation:
             field_mask = prev_field_mask
@@ -517,7 +769,9 @@ class AdService():
 
         new_list_of_asset.update.resource_name = resource_name
         self._google_ads_client.copy_from(new_list_of_asset.update_mask, field_mask)   
-        service.mutate_ads(customer_id=customer_id, operations=[new_list_of_asset])
+        self._rate_limiter.wait()
+        self._ad_service.mutate_ads(
+            customer_id=customer_id, operations=[new_list_of_asset])
     except googleads.errors.GoogleAdsException as failures:
       error_message = ''
       for error in failures.failure.errors:
@@ -538,14 +792,14 @@ class AdService():
     Returns:
       ad_image_asset: New image asset created.
     """
-    asset_service = self._google_ads_client.get_service('AssetService')
     asset_operation = self._google_ads_client.get_type('AssetOperation')
     asset = asset_operation.create
 
     asset.type_ = self._google_ads_client.enums.AssetTypeEnum.IMAGE
     asset.image_asset.data = image_buffer
     asset.name = image_name
-    ad_image_asset = asset_service.mutate_assets(
+    self._rate_limiter.wait()
+    ad_image_asset = self._asset_service.mutate_assets(
         customer_id=customer_id, operations=[asset_operation])
     return ad_image_asset
 
@@ -563,37 +817,106 @@ class AdService():
              'asset.image_asset.full_size.url FROM asset WHERE asset.type IN '
              '("IMAGE")')
 
-    results = self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
+    results = self._search(customer_id, query)
 
+    cached_image_hashes = self._load_image_hash_cache(customer_id)
     image_asset_list = {}
+    resource_names_to_hash = []
     for row in results:
-      image_md5_hash = self._get_md5_hash_of_image_asset(
-          customer_id, row.asset.resource_name,
-          row.asset.image_asset.full_size.url)
-      image_asset_list[row.asset.resource_name] = [
-          row.asset.name, row.asset.image_asset.full_size.url, image_md5_hash
-      ]
+      resource_name = row.asset.resource_name
+      url = row.asset.image_asset.full_size.url
+      image_md5_hash = (
+          self._search_hash_from_prev_list(customer_id, resource_name, url) or
+          cached_image_hashes.get((resource_name, url)))
+      image_asset_list[resource_name] = [row.asset.name, url, image_md5_hash]
+      if not image_md5_hash:
+        resource_names_to_hash.append(resource_name)
+
+    # Downloads are I/O bound, so images missing from the previous list are
+    # fetched and hashed concurrently. A failed download leaves the hash empty
+    # and is not cached, so it is downloaded again next time.
+    if resource_names_to_hash:
+      with futures.ThreadPoolExecutor(
+          max_workers=_IMAGE_DOWNLOAD_POOL_SIZE) as executor:
+        hash_futures = {
+            resource_name: executor.submit(
+                self._get_md5_hash_of_image_url,
+                image_asset_list[resource_name][1])
+            for resource_name in resource_names_to_hash
+        }
+      image_hashes = []
+      for resource_name, hash_future in hash_futures.items():
+        url = image_asset_list[resource_name][1]
+        try:
+          image_md5_hash = hash_future.result()
+        except requests.RequestException as e:
+          _LOGGER.warning('Unable to download image asset %s from %s: %r',
+                          resource_name, url, e)
+          continue
+        image_asset_list[resource_name][2] = image_md5_hash
+        image_hashes.append((resource_name, url, image_md5_hash))
+      if image_hashes:
+        self._save_image_hash_cache(customer_id, image_hashes)
     self._store_prev_image_asset_list(customer_id, image_asset_list)
     return image_asset_list
 
-  def _get_md5_hash_of_image_asset(self, customer_id, resource_name, url):
-    """Gets md5 hash of image asset by searching previous list or calculating from image.
+  def _load_image_hash_cache(self, customer_id):
+    """Loads md5 hashes of image assets calculated in previous runs.
+
+    Args:
+      customer_id: target customer id.
+
+    Returns:
+      A dictionary where key is (resource name, url) and value is md5 hash.
+    """
+    try:
+      with contextlib.closing(sqlite3.connect(_IMAGE_HASH_CACHE_FILE)) as conn:
+        conn.execute(_CREATE_IMAGE_HASH_TABLE_QUERY)
+        rows = conn.execute(
+            'SELECT resource_name, url, md5_hash FROM image_md5_hash '
+            'WHERE customer_id = ?', (str(customer_id),)).fetchall()
+    except sqlite3.Error:
+      _LOGGER.exception('Unable to read the image hash cache.')
+      return {}
+    return {(resource_name, url): md5_hash
+            for resource_name, url, md5_hash in rows}
+
+  def _save_image_hash_cache(self, customer_id, image_hashes):
+    """Saves md5 hashes of image assets for the next runs.
+
+    Args:
+      customer_id: target customer id.
+      image_hashes: list of (resource name, url, md5 hash).
+    """
+    try:
+      with contextlib.closing(sqlite3.connect(_IMAGE_HASH_CACHE_FILE)) as conn:
+        with conn:
+          conn.execute(_CREATE_IMAGE_HASH_TABLE_QUERY)
+          conn.executemany(
+              'INSERT OR REPLACE INTO image_md5_hash VALUES (?, ?, ?, ?)',
+              [(str(customer_id), resource_name, url, md5_hash)
+               for resource_name, url, md5_hash in image_hashes])
+    except sqlite3.Error:
+      _LOGGER.exception('Unable to update the image hash cache.')
+
+  def _get_md5_hash_of_image_url(self, url):
+    """Downloads an image and calculates its md5 hash.
 
     Args:
-      customer_id: target Google Ads customer id.
-      resource_name: resource name of target image assset
       url: url of target image assset
 
     Returns:
       Md5 hexdigest of target image asset.
+
+    Raises:
+      requests.RequestException: If the image could not be downloaded.
     """
-    image_md5_hash = self._search_hash_from_prev_list(customer_id,
-                                                      resource_name, url)
-    if image_md5_hash:
-      return image_md5_hash
-    image_buffer = io.BytesIO(requests.get(url).content).read()
-    result = md5(image_buffer)
+    result = md5()
+    with self._http_session.get(
+        url, stream=True, timeout=_IMAGE_DOWNLOAD_TIMEOUT_SECONDS) as response:
+      response.raise_for_status()
+      for chunk in response.iter_content(chunk_size=_IMAGE_DOWNLOAD_CHUNK_SIZE):
+        result.update(chunk)
     return result.hexdigest()
 
   def _search_hash_from_prev_list(self, customer_id, resource_name, url):
@@ -628,22 +951,25 @@ class AdService():
     self.prev_image_asset_list = image_asset_list
 
   def _get_ad_and_ad_type_by_ad_group_id_list(self, customer_id,
-                                              ad_group_id_list):
+                                              ad_group_id_list,
+                                              skip_missing=False):
     """Gets Ad type and Ad by ad group list.
 
     Args:
       customer_id: customer id.
       ad_group_id_list: ad group id list.
+      skip_missing: if True, ad group ids without an ad are left out of the
+        result instead of raising ValueError.
 
     Returns:
       A dictionary of tuple where the tuple is (Ad object, Ad type) and the
       dictionary is (Ad group id, tuple).
 
     Raises:
-      ValueError: ad group id doesn't exist.
+      ValueError: ad group id doesn't exist and skip_missing is False.
     """
     if not ad_group_id_list:
-      return []
+      return {}
 
     self._update_cache_ad_group_ad(customer_id)
 
@@ -652,6 +978,8 @@ class AdService():
       id_pair = (customer_id, ad_group_id)
 
       if id_pair not in self._cache_ad_group_ad:
+        if skip_missing:
+          continue
         raise ValueError(f'This {ad_group_id} ad_group does not have ad.'
                          ' Kindly check if the ad group id is correct.')
       ad_group_ad_id_list.append(str(self._cache_ad_group_ad[id_pair][1]))
@@ -699,30 +1027,15 @@ class AdService():
     Returns:
       A dictionary of asset count.
     """
-    count = {}
-    count['DESCRIPTION'] = 0
-    count['HEADLINE'] = 0
-    count['VIDEO'] = 0
-    count['IMAGE'] = 0
-    if ad_group_ad_type == self._google_ads_client.enums.AdTypeEnum.APP_AD:
-      for row in response:
-        count['DESCRIPTION'] = count['DESCRIPTION'] + len(
-            row.ad_group_ad.ad.app_ad.descriptions)
-        count['HEADLINE'] = count['HEADLINE'] + len(
-            row.ad_group_ad.ad.app_ad.headlines)
-        count['IMAGE'] = count['IMAGE'] + len(row.ad_group_ad.ad.app_ad.images)
-        count['VIDEO'] = count['VIDEO'] + len(
-            row.ad_group_ad.ad.app_ad.youtube_videos)
+    if ad_group_ad_type == self._app_ad_type:
+      asset_getters = _AD_ASSET_GETTERS['app_ad']
     else:
-      for row in response:
-        count['DESCRIPTION'] = count['DESCRIPTION'] + len(
-            row.ad_group_ad.ad.app_engagement_ad.descriptions)
-        count['HEADLINE'] = count['HEADLINE'] + len(
-            row.ad_group_ad.ad.app_engagement_ad.headlines)
-        count['IMAGE'] = count['IMAGE'] + len(
-            row.ad_group_ad.ad.app_engagement_ad.images)
-        count['VIDEO'] = count['VIDEO'] + len(
-            row.ad_group_ad.ad.app_engagement_ad.videos)
+      asset_getters = _AD_ASSET_GETTERS['app_engagement_ad']
+
+    count = dict.fromkeys(_AD_ASSET_FIELDS['app_ad'], 0)
+    for row in response:
+      for asset_type, asset_getter in asset_getters:
+        count[asset_type] += len(asset_getter(row))
 
     return (count, ad_group_ad_type)
 
@@ -761,8 +1074,7 @@ class AdService():
         ' "GOOD", "LOW") '
         f'AND ad_group_ad_asset_view.field_type = "{asset_type}" ')
 
-    return self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
+    return self._search(customer_id, query)
 
   def _get_asset_by_ad_group_ad_id(self, customer_id, ad_group_ad_id):
     """Gets asset data from an ad group.
@@ -774,21 +1086,8 @@ class AdService():
     Returns:
       An iterator of asset data object.
     """
-    query = ('SELECT '
-             'ad_group_ad.ad.id, '
-             'ad_group_ad.ad.app_ad.descriptions, '
-             'ad_group_ad.ad.app_ad.headlines, '
-             'ad_group_ad.ad.app_ad.youtube_videos, '
-             'ad_group_ad.ad.app_ad.images, '
-             'ad_group_ad.ad.app_engagement_ad.descriptions, '
-             'ad_group_ad.ad.app_engagement_ad.headlines, '
-             'ad_group_ad.ad.app_engagement_ad.videos, '
-             'ad_group_ad.ad.app_engagement_ad.images '
-             'FROM ad_group_ad '
-             f'WHERE ad_group_ad.ad.id = {ad_group_ad_id}')
-
-    return self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
+    return self._get_asset_by_ad_group_ad_id_list(customer_id,
+                                                  [str(ad_group_ad_id)])
 
   def _get_asset_by_ad_group_ad_id_list(self, customer_id, ad_group_ad_id_list):
     """Gets asset data from an ad group list.
@@ -800,87 +1099,72 @@ class AdService():
     Returns:
       An iterator of asset data object.
     """
-    query = ('SELECT '
-             'ad_group.id,'
-             'ad_group_ad.ad.id, '
-             'ad_group_ad.ad.app_ad.descriptions, '
-             'ad_group_ad.ad.app_ad.headlines, '
-             'ad_group_ad.ad.app_ad.youtube_videos, '
-             'ad_group_ad.ad.app_ad.images, '
-             'ad_group_ad.ad.app_engagement_ad.descriptions, '
-             'ad_group_ad.ad.app_engagement_ad.headlines, '
-             'ad_group_ad.ad.app_engagement_ad.videos, '
-             'ad_group_ad.ad.app_engagement_ad.images '
-             'FROM ad_group_ad '
-             f'WHERE ad_group_ad.ad.id in ({",".join(ad_group_ad_id_list)})')
-    return self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
+    # Large id lists are split into several smaller queries, which are run
+    # concurrently.
+    queries = []
+    for i in range(0, len(ad_group_ad_id_list), _AD_GROUP_AD_ID_CHUNK_SIZE):
+      ad_group_ad_ids = ad_group_ad_id_list[i:i + _AD_GROUP_AD_ID_CHUNK_SIZE]
+      queries.append(
+          'SELECT '
+          'ad_group.id,'
+          'ad_group_ad.ad.id, '
+          'ad_group_ad.ad.app_ad.descriptions, '
+          'ad_group_ad.ad.app_ad.headlines, '
+          'ad_group_ad.ad.app_ad.youtube_videos, '
+          'ad_group_ad.ad.app_ad.images, '
+          'ad_group_ad.ad.app_engagement_ad.descriptions, '
+          'ad_group_ad.ad.app_engagement_ad.headlines, '
+          'ad_group_ad.ad.app_engagement_ad.videos, '
+          'ad_group_ad.ad.app_engagement_ad.images '
+          'FROM ad_group_ad '
+          f'WHERE ad_group_ad.ad.id in ({",".join(ad_group_ad_ids)})')
+
+    if len(queries) == 1:
+      return self._search(customer_id, queries[0])
+
+    with futures.ThreadPoolExecutor(
+        max_workers=_MAX_QUERY_WORKERS) as executor:
+      responses = executor.map(self._search, itertools.repeat(customer_id),
+                               queries)
+      return [row for response in responses for row in response]
 
   def _insert_existing_text_asset(self, asset_operation, ad_group_ad_id,
-                                  ad_group_ad_type, asset_type, customer_id):
-    response = self._get_asset_by_ad_group_ad_id(
-        str(customer_id), str(ad_group_ad_id))
-    if ad_group_ad_type == self._google_ads_client.enums.AdTypeEnum.APP_AD:
-      for row in response:
-        if asset_type == 'HEADLINE':
-          if(row.ad_group_ad.ad.app_ad.headlines):
-            for texts in row.ad_group_ad.ad.app_ad.headlines:
-              text_asset = self._google_ads_client.get_type('AdTextAsset')
-              text_asset.text = texts.text
-              asset_operation.append(text_asset)
-        else:
-          if(row.ad_group_ad.ad.app_ad.descriptions):
-            for texts in row.ad_group_ad.ad.app_ad.descriptions:
-              text_asset = self._google_ads_client.get_type('AdTextAsset')
-              text_asset.text = texts.text
-              asset_operation.append(text_asset)
+                                  ad_group_ad_type, asset_type, customer_id,
+                                  response=None):
+    if response is None:
+      response = self._get_asset_by_ad_group_ad_id(customer_id, ad_group_ad_id)
+    if ad_group_ad_type == self._app_ad_type:
+      ad_field = 'app_ad'
     else:
-      for row in response:
-        if asset_type == 'HEADLINE':
-          if(row.ad_group_ad.ad.app_engagement_ad.headlines):
-            for texts in row.ad_group_ad.ad.app_engagement_ad.headlines:
-              text_asset = self._google_ads_client.get_type('AdTextAsset')
-              text_asset.text = texts.text
-              asset_operation.append(text_asset)
-        else:
-          if(row.ad_group_ad.ad.app_engagement_ad.descriptions):
-            for texts in row.ad_group_ad.ad.app_engagement_ad.descriptions:
-              text_asset = self._google_ads_client.get_type('AdTextAsset')
-              text_asset.text = texts.text
-              asset_operation.append(text_asset)
+      ad_field = 'app_engagement_ad'
+    if asset_type != 'HEADLINE':
+      asset_type = 'DESCRIPTION'
+    # Resolves the field once instead of per row.
+    get_text_list = operator.attrgetter(
+        f'ad_group_ad.ad.{ad_field}.{_AD_ASSET_FIELDS[ad_field][asset_type]}')
+    ad_text_asset_type = self._ad_text_asset_type
+    for row in response:
+      for texts in get_text_list(row):
+        asset_operation.append(ad_text_asset_type(text=texts.text))
 
   def _insert_existing_media_asset(self, asset_operation, ad_group_ad_id,
-                                   ad_group_ad_type, asset_type, customer_id):
-    response = self._get_asset_by_ad_group_ad_id(
-        str(customer_id), str(ad_group_ad_id))
-    if ad_group_ad_type == self._google_ads_client.enums.AdTypeEnum.APP_AD:
-      for row in response:
-        if asset_type == 'IMAGE':
-          if(row.ad_group_ad.ad.app_ad.images):
-            for media in row.ad_group_ad.ad.app_ad.images:
-                ad_asset = self._google_ads_client.get_type('AdImageAsset')
-                ad_asset.asset = media.asset
-            asset_operation.append(media)
-        else:
-            if(row.ad_group_ad.ad.app_ad.youtube_videos):
-                for media in row.ad_group_ad.ad.app_ad.youtube_videos:
-                    ad_asset = self._google_ads_client.get_type('AdVideoAsset')
-                    ad_asset.asset = media.asset
-                    asset_operation.append(ad_asset)
+                                   ad_group_ad_type, asset_type, customer_id,
+                                   response=None):
+    if response is None:
+      response = self._get_asset_by_ad_group_ad_id(customer_id, ad_group_ad_id)
+    if ad_group_ad_type == self._app_ad_type:
+      ad_field = 'app_ad'
     else:
-      for row in response:
-        if asset_type == 'IMAGE':
-            if(row.ad_group_ad.ad.app_engagement_ad.images):
-                for media in row.ad_group_ad.ad.app_engagement_ad.images:
-                    ad_asset = self._google_ads_client.get_type('AdImageAsset')
-                    ad_asset.asset = media.asset
-                    asset_operation.append(media)
-        else:
-            if(row.ad_group_ad.ad.app_engagement_ad.videos):
-                for media in row.ad_group_ad.ad.app_engagement_ad.videos:
-                    ad_asset = self._google_ads_client.get_type('AdVideoAsset')
-                    ad_asset.asset = media.asset
-                    asset_operation.append(ad_asset)
+      ad_field = 'app_engagement_ad'
+    if asset_type != 'IMAGE':
+      asset_type = 'VIDEO'
+    # Resolves the field once instead of per row.
+    get_media_list = operator.attrgetter(
+        f'ad_group_ad.ad.{ad_field}.{_AD_ASSET_FIELDS[ad_field][asset_type]}')
+    ad_asset_type = self._ad_media_asset_types[asset_type]
+    for row in response:
+      for media in get_media_list(row):
+        asset_operation.append(ad_asset_type(asset=media.asset))
 
   def _get_text_asset_value_by_asset_id(self, customer_id, asset_id):
     """Gets text asset value by asset id.
@@ -892,17 +1176,9 @@ class AdService():
     Returns:
       Text asset value.
     """
-    query = ('SELECT '
-             'asset.resource_name, '
-             'asset.text_asset.text '
-             'FROM '
-             'asset '
-             f'WHERE asset.resource_name = "{asset_id}"')
-    result = self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
-    for row in result:
-      return row.asset.text_asset.text
-    return ''
+    query = _TEXT_ASSET_VALUE_QUERY.format(asset_id=_to_gaql_string(asset_id))
+    row = next(iter(self._search(customer_id, query)), None)
+    return row.asset.text_asset.text if row is not None else ''
 
   def _get_asset_performance_by_metrics(self, customer_id, ad_group_id,
                                         target_asset_id, asset_type, duration):
@@ -919,79 +1195,124 @@ class AdService():
       duration: performance evaluation duration.
 
     Returns:
-      perf_result: A list of asset performance.
+      perf_result: A list of AssetPerformance.
     """
+    return self._get_asset_performance_by_metrics_list(
+        customer_id, ad_group_id, [target_asset_id], asset_type,
+        duration)[target_asset_id]
+
+  def _get_asset_performance_by_metrics_list(self, customer_id, ad_group_id,
+                                             target_asset_ids, asset_type,
+                                             duration):
+    """Gets performance data of multiple assets of an ad group in one query.
+
+    Args:
+      customer_id: customer id.
+      ad_group_id: ad group id.
+      target_asset_ids: list of asset ids for media assets, texts for text
+        assets.
+      asset_type: 'HEADLINE' or 'DESCRIPTION' or 'IMAGE' or 'VIDEO'.
+      duration: performance evaluation duration.
+
+    Returns:
+      perf_results: A dictionary where key is the target asset id and value is
+      a list of AssetPerformance.
+    """
+    ad_group_perf_results = self._get_asset_performance_by_ad_group_list(
+        customer_id, {ad_group_id: target_asset_ids}, asset_type, duration)
+    return {
+        asset_id: ad_group_perf_results[(ad_group_id, asset_id)]
+        for asset_id in target_asset_ids
+    }
+
+  def _get_asset_performance_by_ad_group_list(self, customer_id,
+                                              asset_ids_by_ad_group,
+                                              asset_type, duration):
+    """Gets performance data of assets of several ad groups in one query.
+
+    Args:
+      customer_id: customer id.
+      asset_ids_by_ad_group: A dictionary where key is the ad group id and value
+        is a list of asset ids for media assets, texts for text assets.
+      asset_type: 'HEADLINE' or 'DESCRIPTION' or 'IMAGE' or 'VIDEO'.
+      duration: performance evaluation duration.
+
+    Returns:
+      perf_results: A dictionary where key is a (ad group id, target asset id)
+      tuple and value is a list of AssetPerformance.
+    """
+    perf_results = {(ad_group_id, asset_id): []
+                    for ad_group_id, asset_ids in asset_ids_by_ad_group.items()
+                    for asset_id in asset_ids}
+    if not perf_results:
+      return perf_results
+
     if asset_type == 'IMAGE':
       asset_type = 'MARKETING_IMAGE'
     elif asset_type == 'VIDEO':
       asset_type = 'YOUTUBE_VIDEO'
 
-    start_date = (_TODAY - datetime.timedelta(days=duration)).date()
-    end_date = (_TODAY - datetime.timedelta(days=1)).strftime('%Y-%m-%d')
+    # For HEADLINE and DESCRIPTION, asset id is text itself.
+    is_text_asset = asset_type == 'HEADLINE' or asset_type == 'DESCRIPTION'
+    if is_text_asset:
+      asset_id_field = 'asset.text_asset.text'
+    else:
+      asset_id_field = 'ad_group_ad_asset_view.asset'
 
-    query = (
-        'SELECT '
-        'ad_group_ad_asset_view.asset, '
-        'ad_group_ad_asset_view.field_type, '
-        'ad_group_ad_asset_view.performance_label,  '
-        'asset.text_asset.text, '
-        'metrics.impressions, '
-        'metrics.conversions, '
-        'metrics.conversions_value, '
-        'metrics.ctr, '
-        'metrics.clicks '
-        'FROM ad_group_ad_asset_view '
-        f'WHERE ad_group.id = {ad_group_id} '
-        f'AND segments.date BETWEEN "{start_date}" AND "{end_date}" '
-        f'AND ad_group_ad_asset_view.field_type = "{asset_type}" '
-        'AND ad_group_ad_asset_view.enabled = True AND '
-        'ad_group_ad_asset_view.performance_label IN ("LOW", "GOOD", "BEST") ')
+    start_date, end_date = _get_date_range(duration)
+
+    # Rows carry the ad group id as a number, so it is mapped back to the id
+    # the caller used.
+    ad_group_ids = {
+        int(ad_group_id): ad_group_id for ad_group_id in asset_ids_by_ad_group
+    }
+    asset_ids = {asset_id for _, asset_id in perf_results}
 
-    if asset_type == 'HEADLINE' or asset_type == 'DESCRIPTION':
-      query += f'AND asset.text_asset.text = "{target_asset_id}" '
+    query = _ASSET_PERFORMANCE_BY_METRICS_QUERY.format(
+        ad_group_ids=', '.join(str(ad_group_id) for ad_group_id in ad_group_ids),
+        start_date=start_date,
+        end_date=end_date,
+        field_type=asset_type,
+        asset_id_field=asset_id_field,
+        asset_ids=_to_gaql_string_list(sorted(asset_ids)))
 
-    results = self._google_ads_client.get_service('GoogleAdsService').search(
-        customer_id=customer_id, query=query)
-    perf_result = []
+    results = self._search(customer_id, query)
+    performance_label_enum = self._get_performance_label()
 
     for row in results:
-      # get asset_id
-      # For HEADLINE and DESCRIPTION, asset id is text itself
-      if asset_type == 'HEADLINE' or asset_type == 'DESCRIPTION':
+      if is_text_asset:
         asset_id = row.asset.text_asset.text
       else:
         asset_id = row.ad_group_ad_asset_view.asset
-      # performance_label
-      performance_label_enum = self._get_performance_label()
-      performance_label = str(
-          performance_label_enum[row.ad_group_ad_asset_view.performance_label])
-
-      if asset_id == target_asset_id:
-        perf = {
-            'ad_group_id': ad_group_id,
-            'asset_id': asset_id,
-            'asset_type': asset_type,
-            'performance_label': performance_label,
-            'impressions': row.metrics.impressions,
-            'conversions': row.metrics.conversions,
-            'conversions_value': row.metrics.conversions_value,
-            'ctr': row.metrics.ctr,
-            'clicks': row.metrics.clicks
-        }
-        perf_result.append(perf)
-
-    return perf_result
+      ad_group_id = ad_group_ids.get(row.ad_group.id)
+      perf_result = perf_results.get((ad_group_id, asset_id))
+      if perf_result is None:
+        continue
+
+      performance_label = performance_label_enum[
+          row.ad_group_ad_asset_view.performance_label]
+      metrics = row.metrics
+      perf_result.append(
+          AssetPerformance(ad_group_id, asset_id, asset_type,
+                           performance_label, metrics.impressions,
+                           metrics.conversions, metrics.conversions_value,
+                           metrics.ctr, metrics.clicks))
+
+    return perf_results
 
   def _get_performance_label(self):
     """Gets performance_label dict.
 
+    The dict is built once and reused for the lifetime of the instance.
+
     Returns:
       result: name & enum value of performance label.
     """
-    result = self._google_ads_client.get_type(
-        'AssetPerformanceLabelEnum').AssetPerformanceLabel
-    enum_to_dict = result.__dict__['_member_map_']
-    result = {}
-    for k, v in enum_to_dict.items():
-      result[v.value] = k
-    return result
+    if self._performance_label_names is None:
+      result = self._google_ads_client.get_type(
+          'AssetPerformanceLabelEnum').AssetPerformanceLabel
+      enum_to_dict = result.__dict__['_member_map_']
+      self._performance_label_names = {
+          v.value: k for k, v in enum_to_dict.items()
+      }
+    return self._performance_label_names
@@ -13,7 +13,6 @@
 # limitations under the License.
 """Gets the OAuth2 credential from file."""
 
-import os.path
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
@@ -22,21 +21,21 @@ from googleapiclient.discovery import build
 import yaml
 
 _TOKEN = 'config/token.json'
-_SCOPES = [
+_SCOPES = (
     'https://www.googleapis.com/auth/drive',
     'https://www.googleapis.com/auth/spreadsheets',
-]
+)
 _YOUTUBE_TOKEN = 'config/yt_token.json'
-_YOUTUBE_SCOPES = [
+_YOUTUBE_SCOPES = (
     'https://www.googleapis.com/auth/youtube.readonly',
     'https://www.googleapis.com/auth/youtube.upload',
-]
+)
 
 
 def get_credentials_from_file(
     service_account_file='PATH_TO_SERVICE_JSON',
     client_secret_file='PATH_TO_CLIENT_SECRET_JSON',
-    scopes=_SCOPES,
+    scopes=None,
     token=_TOKEN,
     port=8008,
 ):
@@ -45,18 +44,20 @@ def get_credentials_from_file(
   Args:
     service_account_file: a string of path points to service account file.
     client_secret_file: a string of path points to client secret file.
-    scopes: a list of the required scopes strings for this credential.
+    scopes: a sequence of the required scopes strings for this credential.
+      Defaults to the Drive and Sheets scopes.
     token: path to the token.json file.
 
   Returns:
     An OAuth Credentials object for the authenticated user.
   """
-  creds = None
-
+  if scopes is None:
+    scopes = _SCOPES
   try:
-    if os.path.exists(token):
-      creds = Credentials.from_authorized_user_file(token, scopes)
-  except:
+    creds = Credentials.from_authorized_user_file(token, scopes)
+  except FileNotFoundError:
+    creds = None
+  except (OSError, ValueError):
     raise Exception(
         'Error while load OAuth credentials, no credentials returned.'
     )
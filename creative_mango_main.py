@@ -14,11 +14,14 @@
 """Main operation script for Creative mango.
 
 This script will run each step in following order:
-get_file.py -> creative_remover.py -> creative_uploader.py ->
+(get_file.py & creative_remover.py, concurrently) -> creative_uploader.py ->
 (optional)refresh_mapping_sheet.py
 Please set configs in config/setup.yaml file before running the script.
 """
+from concurrent import futures
 import datetime
+import logging
+import time
 
 import creative_remover
 import creative_uploader
@@ -26,8 +29,12 @@ import get_file
 import refresh_mapping_sheet
 import yaml
 
+_LOGGER = logging.getLogger(__name__)
 _SET_UP_FILE = 'config/setup.yaml'
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def init_config(setup_file):
   """Get configs from config/setup.yaml file.
@@ -39,23 +46,18 @@ def init_config(setup_file):
     cfg: configs.
   """
   with open(setup_file, 'r') as ymlfile:
-    cfg = yaml.safe_load(ymlfile)
+    cfg = yaml.load(ymlfile, Loader=_YAML_LOADER)
   return cfg
 
 
-def main():
-  """Main Operation for creative mango."""
-  start_time = datetime.datetime.today()
-  print(f'START TIME: {start_time}')
-
-  cfg = init_config(setup_file=_SET_UP_FILE)
-  if 'driveFolderIds' not in cfg.keys():
-    cfg['driveFolderIds'] = None
-  if 'youtubeWindow' not in cfg.keys():
-    cfg['youtubeWindow'] = None
+def run_get_file(cfg):
+  """Gets list of IMAGE & VIDEO file url and updates the Upload Sheet.
 
-  # STEP 1. Get list of IMAAGE & VIDEO File url and update in the Upload Sheet.
-  print(
+  Args:
+    cfg: configs.
+  """
+  logger = logging.getLogger(get_file.__name__)
+  logger.info(
       '--------------------------Start retrieving image & video url operation-----------------------'
   )
   try:
@@ -68,14 +70,20 @@ def main():
         youtube_service_enable=cfg['youtubeServiceEnable'],
         youtube_window=cfg['youtubeWindow'])
   except Exception as error:
-    print('Unable to complete adding assets to Upload Sheet:', repr(error))
-  print(
+    logger.error('Unable to complete adding assets to Upload Sheet: %r', error)
+  logger.info(
       '--------------------------End retrieving image & video url operation-----------------------'
   )
 
-  # STEP 2. Remove time sensitive & low performing assets and evaluate asset
-  # performance.
-  print(
+
+def run_creative_remover(cfg):
+  """Removes time sensitive & low performing assets and evaluates asset performance.
+
+  Args:
+    cfg: configs.
+  """
+  logger = logging.getLogger(creative_remover.__name__)
+  logger.info(
       '--------------------------Start delete & performance evaluation operation-----------------------'
   )
   try:
@@ -85,13 +93,39 @@ def main():
         client_secret=cfg['clientSecret'],
         ads_account=cfg['adsAccount'])
   except Exception as error:
-    print('Unable to complete removing the assets:', repr(error))
-  print(
+    logger.error('Unable to complete removing the assets: %r', error)
+  logger.info(
       '--------------------------End delete & performance evaluation  operation-----------------------'
   )
 
+
+def main():
+  """Main Operation for creative mango."""
+  _LOGGER.info('START TIME: %s', datetime.datetime.today())
+  start_counter = time.perf_counter()
+
+  cfg = init_config(setup_file=_SET_UP_FILE)
+  if 'driveFolderIds' not in cfg.keys():
+    cfg['driveFolderIds'] = None
+  if 'youtubeWindow' not in cfg.keys():
+    cfg['youtubeWindow'] = None
+
+  # STEP 1. Get list of IMAAGE & VIDEO File url and update in the Upload Sheet.
+  # STEP 2. Remove time sensitive & low performing assets and evaluate asset
+  # performance.
+  # Both steps run concurrently, remover deletions included. Step 1 reads
+  # Drive, YouTube and the YT List Sheet and only appends to the Upload Sheet.
+  # Step 2 only touches the Time Managed, Performance Conditions and Change
+  # History Sheets and is the only step calling the Google Ads API. No sheet or
+  # ad is shared, and both must be done before the upload step.
+  with futures.ThreadPoolExecutor(max_workers=2) as executor:
+    futures.wait([
+        executor.submit(run_get_file, cfg),
+        executor.submit(run_creative_remover, cfg),
+    ])
+
   # STEP 3. Upload new assets in the Upload Sheet.
-  print(
+  _LOGGER.info(
       '--------------------------Start Upload operation-----------------------')
   try:
     creative_uploader.uploader_main(
@@ -102,13 +136,13 @@ def main():
         youtube_secrets=cfg['youtubeSecret'],
         youtube_service_enable=cfg['youtubeServiceEnable'])
   except Exception as error:
-    print('Unable to complete uploading the assets:', repr(error))
-  print('--------------------------End Upload operation-----------------------')
+    _LOGGER.error('Unable to complete uploading the assets: %r', error)
+  _LOGGER.info('--------------------------End Upload operation-----------------------')
 
   # STEP 4. If refreshMappingSheetEnable is true, update the Mapping Sheet with
   # up-to-date information.
   if cfg['refreshMappingSheetEnable']:
-    print(
+    _LOGGER.info(
         '--------------------------Start Updating mapping sheet operation-----------------------'
     )
     try:
@@ -118,14 +152,19 @@ def main():
           client_secret=cfg['clientSecret'],
           ads_account=cfg['adsAccount'])
     except Exception as error:
-      print('Unable to complete updating the mapping sheet:', repr(error))
-    print(
+      _LOGGER.error('Unable to complete updating the mapping sheet: %r', error)
+    _LOGGER.info(
         '--------------------------End Updating mapping sheet operation-----------------------'
     )
 
-  end_time = datetime.datetime.today()
-  print(f'END TIME: {end_time} / Execution time: {end_time - start_time}')
+  execution_time = datetime.timedelta(
+      seconds=time.perf_counter() - start_counter)
+  _LOGGER.info('END TIME: %s / Execution time: %s', datetime.datetime.today(),
+               execution_time)
 
 
 if __name__ == '__main__':
+  # get_file and creative_remover run concurrently; the logger name tells
+  # their records apart.
+  logging.basicConfig(level=logging.INFO, format='[%(name)s] %(message)s')
   main()
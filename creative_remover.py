@@ -19,8 +19,15 @@ This tool will find low performing assets based on the delete conditions and
 automatically delete them.
 """
 
+import bisect
+import collections
+from concurrent import futures
 import datetime
 import enum
+import functools
+import itertools
+import logging
+import operator
 import yaml
 from googleapiclient.errors import HttpError
 
@@ -31,6 +38,8 @@ import sheets_api
 
 from google.ads import googleads
 
+_LOGGER = logging.getLogger(__name__)
+
 # Number of columns in the Time Managed sheet should be 12.
 _NUMBER_OF_TIME_MANAGED_SHEET_COLUMNS = 12
 
@@ -43,8 +52,17 @@ _TIME_MANAGE_SHEET_NAME = 'Time Managed'
 _TIME_MANAGED_SHEET_RANGE = 'Time Managed!A2:L'
 _CHANGE_HISTORY_SHEET_RANGE = 'Change History!A2:K'
 
+# Customers queried concurrently by the prefetch helpers. AdService throttles
+# the Google Ads API calls themselves.
+_MAX_CUSTOMER_WORKERS = 8
+
+# Errors a prefetch query of one customer is expected to fail with. The rows of
+# that customer are then looked up one by one, which reports the error per row.
+_PREFETCH_ERRORS = (ValueError, googleads.errors.GoogleAdsException)
+
 # today date
 _TODAY = datetime.datetime.today()
+_TODAY_DATE = _TODAY.date()
 
 
 class TimeManagedColumn(enum.IntEnum):
@@ -82,6 +100,66 @@ class MinimumAdGroupAsset(enum.IntEnum):
   VIDEO = 5
 
 
+# Performance notes of assets that are deleted when Delete by Performance is
+# checked.
+_PERFORMANCE_NOTES_TO_DELETE = frozenset(('LOW', 'NO RECENT RECORDS'))
+
+# Performance Condition metrics and how the reported values are compared.
+_PERFORMANCE_METRICS = (
+    ('impressions', int),
+    ('conversions', int),
+    ('conversions_value', float),
+    ('ctr', float),
+    ('clicks', int),
+)
+
+# Asset type names used in the Time Managed Sheet error notes.
+_ASSET_TYPE_NOUNS = {
+    'HEADLINE': 'headline',
+    'DESCRIPTION': 'description',
+    'IMAGE': 'image',
+    'VIDEO': 'video',
+}
+
+# Removes white space from sheet values, and dashes from customer ids.
+_WHITE_SPACE_TABLE = str.maketrans('', '', ' ')
+_CUSTOMER_ID_TABLE = str.maketrans('', '', '- ')
+
+# Columns a Time Managed row must fill in to be managed by this tool.
+_get_required_time_managed_values = operator.itemgetter(*map(
+    int, (TimeManagedColumn.CUSTOMER_ID, TimeManagedColumn.AD_GROUP_ID,
+          TimeManagedColumn.ASSET_ID_OR_TEXT, TimeManagedColumn.CREATIVE_TYPE,
+          TimeManagedColumn.START_DATE)))
+
+# Performance Condition Sheet values, in the order of PerformanceCondition.
+_get_performance_conditions = operator.itemgetter(
+    *map(int, PerformanceCondition))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(target_date):
+  """Parses a YYYY-MM-DD date.
+
+  Sheets usually hold many rows with the same dates, so results are cached.
+
+  Args:
+    target_date: date string.
+
+  Returns:
+    The date.
+
+  Raises:
+    ValueError: Date format value error.
+  """
+  # fromisoformat is only used for zero padded YYYY-MM-DD, as newer Pythons
+  # also accept other ISO 8601 forms such as 20240105 or 2024-W01-5.
+  if (len(target_date) == 10 and target_date.isascii() and
+      target_date[4] == target_date[7] == '-' and
+      (target_date[:4] + target_date[5:7] + target_date[8:]).isdigit()):
+    return datetime.date.fromisoformat(target_date)
+  return datetime.datetime.strptime(target_date, '%Y-%m-%d').date()
+
+
 def check_date_format(target_date):
   """Checks the date format.
 
@@ -98,9 +176,7 @@ def check_date_format(target_date):
     Exception: Unknown error while checking the date format.
   """
   try:
-    date_split = datetime.datetime.strptime(target_date, '%Y-%m-%d')
-    result = datetime.datetime(date_split.year, date_split.month,
-                               date_split.day).date()
+    result = _parse_date(target_date)
   except ValueError:
     result = ('END_DATE is not correct format. Kindly follow the '
               'format of YYYY-MM-DD.')
@@ -113,7 +189,72 @@ def check_date_format(target_date):
   return True, result
 
 
-def unqualified_to_delete(ads_service, customer_id, ad_group_id, asset_type):
+def prefetch_ad_group_info(ads_service, ad_groups):
+  """Gets the number of assets and the ad type of ad groups in bulk.
+
+  Ad groups are queried with one GAQL query per customer instead of one per
+  ad group, and customers are queried concurrently. Ad groups without an ad,
+  and all ad groups of a customer whose query fails, are left out and looked
+  up one by one later, which reports the error per row.
+
+  Args:
+    ads_service: Google ads api service.
+    ad_groups: iterable of (customer_id, ad_group_id) tuples.
+
+  Returns:
+    ad_group_info: A dictionary where key is (customer_id, ad_group_id) and
+    value is a tuple of the number of assets and the ad type.
+  """
+  ad_group_ids_by_customer = collections.defaultdict(set)
+  for customer_id, ad_group_id in ad_groups:
+    ad_group_ids_by_customer[customer_id].add(ad_group_id)
+
+  ad_group_info = {}
+  with futures.ThreadPoolExecutor(
+      max_workers=_MAX_CUSTOMER_WORKERS) as executor:
+    customer_futures = {
+        customer_id: executor.submit(
+            ads_service._get_ad_and_ad_type_by_ad_group_id_list,
+            customer_id,
+            sorted(ad_group_ids),
+            skip_missing=True)
+        for customer_id, ad_group_ids in ad_group_ids_by_customer.items()
+    }
+
+  for customer_id, customer_future in customer_futures.items():
+    try:
+      results = customer_future.result()
+    except _PREFETCH_ERRORS as e:
+      _LOGGER.warning(
+          'Unable to prefetch ad groups of customer %s, looking them up one '
+          'by one: %r', customer_id, e)
+      continue
+    for ad_group_id, info in results.items():
+      ad_group_info[(customer_id, ad_group_id)] = info
+
+  return ad_group_info
+
+
+def get_ad_and_ad_type(ads_service, customer_id, ad_group_id,
+                       ad_group_info=None):
+  """Gets the number of assets and the ad type of an ad group.
+
+  Args:
+    ads_service: Google ads api service.
+    customer_id: Google ads customer id.
+    ad_group_id: Ad group id.
+    ad_group_info: optional result of prefetch_ad_group_info.
+
+  Returns:
+    A tuple of the number of assets and the ad type.
+  """
+  if ad_group_info and (customer_id, ad_group_id) in ad_group_info:
+    return ad_group_info[(customer_id, ad_group_id)]
+  return ads_service._get_ad_and_ad_type(customer_id, ad_group_id)
+
+
+def unqualified_to_delete(ads_service, customer_id, ad_group_id, asset_type,
+                          pending_count=0, ad_group_info=None):
   """Checks the number of assets in the AdGroup.
 
   If the number of assets (per asset_type) is smaller than the number defined
@@ -125,6 +266,9 @@ def unqualified_to_delete(ads_service, customer_id, ad_group_id, asset_type):
     customer_id: Google ads customer id.
     ad_group_id: Ad group id.
     asset_type: Asset type.
+    pending_count: number of assets of asset_type already queued for removal
+      from the AdGroup.
+    ad_group_info: optional result of prefetch_ad_group_info.
 
   Returns:
     execution result.
@@ -136,55 +280,42 @@ def unqualified_to_delete(ads_service, customer_id, ad_group_id, asset_type):
     assets.
   """
   try:
-    creative_number = ads_service._get_ad_and_ad_type(customer_id, ad_group_id)
+    creative_number = get_ad_and_ad_type(ads_service, customer_id, ad_group_id,
+                                         ad_group_info)
   except googleads.errors.GoogleAdsException as failures:
-    error_message = ''
-    for error in failures.failure.errors:
-      error_message += ads_api_error_translation.translate_ads_api_errors(
-          error.message)
+    error_message = ads_api_error_translation.get_error_message(
+        failures.failure.errors)
     return False, error_message
   except Exception as e:
     error_message = f'Unable to read current number of assets: {str(e)}'
     return False, error_message
 
-  if asset_type == 'HEADLINE':
-    if creative_number[0]['HEADLINE'] <= MinimumAdGroupAsset.HEADLINE:
-      error_message = (f'Not enough headlines in the AdGroup. The number of '
-                       f'headline should be greater than '
-                       f'{MinimumAdGroupAsset.HEADLINE}')
-      return False, error_message
-  elif asset_type == 'DESCRIPTION':
-    if creative_number[0]['DESCRIPTION'] <= MinimumAdGroupAsset.DESCRIPTION:
-      error_message = (f'Not enough descriptions in the AdGroup. The number '
-                       f'of description should be greater than '
-                       f'{MinimumAdGroupAsset.DESCRIPTION}')
-      return False, error_message
-  elif asset_type == 'IMAGE':
-    if creative_number[0]['IMAGE'] <= MinimumAdGroupAsset.IMAGE:
-      error_message = (f'Not enough images in the AdGroup. The number of '
-                       f'image should be greater than '
-                       f'{MinimumAdGroupAsset.IMAGE}')
-      return False, error_message
-  elif asset_type == 'VIDEO':
-    if creative_number[0]['VIDEO'] <= MinimumAdGroupAsset.VIDEO:
-      error_message = (f'Not enough videos in the AdGroup. The number of '
-                       f'video should be greater than '
-                       f'{MinimumAdGroupAsset.VIDEO}')
-      return False, error_message
+  asset_noun = _ASSET_TYPE_NOUNS.get(asset_type)
+  if asset_noun is None:
+    return True, ''
+
+  minimum_assets = MinimumAdGroupAsset[asset_type]
+  # Assets already queued for removal from the AdGroup are not counted.
+  if creative_number[0][asset_type] - pending_count <= minimum_assets:
+    error_message = (f'Not enough {asset_noun}s in the AdGroup. The number of '
+                     f'{asset_noun} should be greater than {minimum_assets}')
+    return False, error_message
 
   return True, ''
 
 
 def delete_asset_from_ads(ads_service, customer_id, ad_group_id,
-                          asset_to_remove, asset_type):
+                          assets_to_remove):
   """Delete asset operation.
 
+  All assets are removed from the ad with a single mutate.
+
   Args:
     ads_service: Google ads api service.
     customer_id: Google ads customer id.
     ad_group_id: Ad group id.
-    asset_to_remove: For text assets, text itself. For media assets, asset id.
-    asset_type: Asset type.
+    assets_to_remove: list of (asset_type, asset) tuples. For text assets,
+      asset is the text itself. For media assets, asset id.
 
   Returns:
     delete result.
@@ -195,23 +326,11 @@ def delete_asset_from_ads(ads_service, customer_id, ad_group_id,
     Exception: If unknown error occurs while deleting the asset.
   """
   try:
-    if asset_type == 'HEADLINE':
-      ads_service._remove_headline_asset_from_campaign(asset_to_remove,
-                                                       customer_id, ad_group_id)
-    elif asset_type == 'DESCRIPTION':
-      ads_service._remove_description_asset_from_campaign(
-          asset_to_remove, customer_id, ad_group_id)
-    elif asset_type == 'IMAGE':
-      ads_service._remove_image_asset_from_campaign(asset_to_remove,
-                                                    customer_id, ad_group_id)
-    elif asset_type == 'VIDEO':
-      ads_service._remove_video_asset_from_campaign(asset_to_remove,
-                                                    customer_id, ad_group_id)
+    ads_service._remove_assets_from_campaign(assets_to_remove, customer_id,
+                                             ad_group_id)
   except googleads.errors.GoogleAdsException as failures:
-    error_message = ''
-    for error in failures.failure.errors:
-      error_message += ads_api_error_translation.translate_ads_api_errors(
-          error.message)
+    error_message = ads_api_error_translation.get_error_message(
+        failures.failure.errors)
     return False, error_message
   except Exception as e:
     error_message = f'Unable to delete: {str(e)}'
@@ -220,48 +339,73 @@ def delete_asset_from_ads(ads_service, customer_id, ad_group_id,
   return True, ''
 
 
-def remove_asset(ads_service, customer_id, ad_group_id, asset_to_remove,
-                 asset_type):
-  """Remove asset from the ad.
+def remove_assets(ads_service, pending_deletes, ad_group_info=None):
+  """Remove assets from the ads.
 
-  Check the number of current asset in the ad first, and if there is enough
-  assets, remove the asset.
+  Deletes are grouped by ad group, so each ad is updated with one mutate. The
+  number of current assets in the ad is checked first, counting the assets
+  already queued for the same ad, and only assets that leave enough assets
+  in the ad are removed. If the mutate of an ad fails, its assets are removed
+  one by one, so only the rows that fail on their own report an error.
 
   Args:
     ads_service: Google Ads API service.
-    customer_id: Google ads customer id.
-    ad_group_id: Ad group id.
-    asset_to_remove: For text assets, text itself. For media assets, asset id.
-    asset_type: Asset type.
+    pending_deletes: list of (customer_id, ad_group_id, asset_to_remove,
+      asset_type) tuples. For text assets, asset_to_remove is the text itself.
+      For media assets, asset id.
+    ad_group_info: optional result of prefetch_ad_group_info.
 
   Returns:
-    result: execution result.
-    error_message: error message.
+    A list of (result, error_message) tuples in the order of pending_deletes.
   """
-  error_message = ''
-  # Check the number of assets in the current AdGroup.
-  result, error_message = unqualified_to_delete(ads_service, customer_id,
-                                                ad_group_id, asset_type)
-  # If the nubmer of assets meets the criteria, delete asset from the ad
-  if result:
-    result, error_message = delete_asset_from_ads(ads_service, customer_id,
-                                                  ad_group_id, asset_to_remove,
-                                                  asset_type)
+  delete_results = [None] * len(pending_deletes)
+  deletes_by_ad_group = collections.defaultdict(list)
+  for index, (customer_id, ad_group_id, _, _) in enumerate(pending_deletes):
+    deletes_by_ad_group[(customer_id, ad_group_id)].append(index)
+
+  for (customer_id, ad_group_id), indices in deletes_by_ad_group.items():
+    pending_counts = collections.Counter()
+    assets_to_remove = []
+    qualified_indices = []
+    for index in indices:
+      (_, _, asset_to_remove, asset_type) = pending_deletes[index]
+      # Check the number of assets in the current AdGroup.
+      result, error_message = unqualified_to_delete(
+          ads_service, customer_id, ad_group_id, asset_type,
+          pending_counts[asset_type], ad_group_info)
+      if not result:
+        delete_results[index] = (result, error_message)
+        continue
+      pending_counts[asset_type] += 1
+      assets_to_remove.append((asset_type, asset_to_remove))
+      qualified_indices.append(index)
+
+    # If the nubmer of assets meets the criteria, delete assets from the ad
+    if assets_to_remove:
+      delete_result = delete_asset_from_ads(ads_service, customer_id,
+                                            ad_group_id, assets_to_remove)
+      if delete_result[0] or len(assets_to_remove) == 1:
+        for index in qualified_indices:
+          delete_results[index] = delete_result
+      else:
+        # Removing a subset keeps the ad above its minimum, as the check above
+        # counted every queued asset as removed.
+        for index, asset in zip(qualified_indices, assets_to_remove):
+          delete_results[index] = delete_asset_from_ads(
+              ads_service, customer_id, ad_group_id, [asset])
 
-  return result, error_message
+  return delete_results
 
 
-def update_error_note(sheets_service, update_errors, time_managed_sheet_id):
-  """Update error message in the Time Managed sheet.
+def get_update_error_notes(update_errors, time_managed_sheet_id):
+  """Gets requests to update error messages in the Time Managed sheet.
 
   Args:
-    sheets_service: Google sheet api service.
     update_errors: row information and error message.
     time_managed_sheet_id: Time Managed Sheet id.
 
-  Raises:
-    Exception: If unknown error occurs while updating rows in the Time Managed
-    Sheet.
+  Returns:
+    update_request_list: cell information for updating error notes.
   """
   update_request_list = []
   for update_row in update_errors:
@@ -269,93 +413,164 @@ def update_error_note(sheets_service, update_errors, time_managed_sheet_id):
     update_error_note = get_update_error_note(update_row, update_index,
                                               time_managed_sheet_id)
     update_request_list.append(update_error_note)
+  return update_request_list
 
-  try:
-    sheets_service.batch_update_requests(update_request_list)
-  except Exception as e:
-    print(f'Unable to update Time Managed Sheet rows: {str(e)}')
 
+def get_delete_rows(delete_assets, time_managed_sheet_id):
+  """Gets requests to delete rows in the Time Managed sheet.
 
-def delete_row_by_index(sheets_service, delete_assets, time_managed_sheet_id):
-  """Delete row in the Time Managed sheet.
+  Consecutive rows are deleted with one request per run of rows.
 
   Args:
-    sheets_service: Google sheet api service.
     delete_assets: row to delete.
     time_managed_sheet_id: Time Managed Sheet id.
 
-  Raises:
-    Exception: If unknown error occurs while deleting rows in the Time Managed
-    Sheet.
+  Returns:
+    delete_request_list: row ranges to delete.
   """
+  row_indices = sorted({delete_row[0] for delete_row in delete_assets})
   delete_request_list = []
-  i = 1
-  for delete_row in delete_assets:
-    delete_row_index = delete_row[0]
+  # Rows of a run share row_index - position. Runs are deleted from the bottom
+  # up, so deleting a run doesn't shift the rows of the runs still to delete.
+  for _, run in itertools.groupby(
+      enumerate(row_indices), key=lambda item: item[1] - item[0]):
+    run = list(run)
     delete_request = {
         'deleteDimension': {
             'range': {
                 'sheetId': time_managed_sheet_id,
                 'dimension': 'ROWS',
-                'startIndex': delete_row_index - i,
-                'endIndex': delete_row_index - i + 1
+                'startIndex': run[0][1] - 1,
+                'endIndex': run[-1][1]
             }
         }
     }
     delete_request_list.append(delete_request)
-    i += 1
+  delete_request_list.reverse()
+  return delete_request_list
 
-  try:
-    sheets_service.batch_update_requests(delete_request_list)
-  except Exception as e:
-    print(f'Unable to update/delete Time Managed Sheet rows: {str(e)}')
+
+def get_clear_notes(time_managed_sheet_id):
+  """Gets the request to clear columns J to L in the Time Managed sheet.
+
+  Args:
+    time_managed_sheet_id: Time Managed Sheet id.
+
+  Returns:
+    clear_notes: cell information for clearing the Delete by Performance,
+    Performance and Error Note columns from the second row down.
+  """
+  clear_notes = {
+      'updateCells': {
+          'range': {
+              'sheetId': time_managed_sheet_id,
+              'startRowIndex': 1,
+              'startColumnIndex': TimeManagedColumn.DELETE_BY_PERFORMANCE,
+              'endColumnIndex': TimeManagedColumn.ERROR_NOTE + 1
+          },
+          'fields': 'userEnteredValue'
+      }
+  }
+  return clear_notes
 
 
 def update_time_managed_sheet(sheets_service, update_errors,
                               time_managed_sheet_id, delete_assets):
   """Update row in Time Managed Sheet.
 
+  Clearing the notes, writing error messages and deleting rows are sent in
+  one batch update. Rows are deleted last, so the row indices of the error
+  messages still point at the right rows.
+
   Args:
     sheets_service: Google sheet api service.
     update_errors: error messages to update in the Time Managed Sheet.
     time_managed_sheet_id: time managed sheet id.
     delete_assets: assets to delete in the Time Managed Sheet.
 
+  Returns:
+    True if the Time Managed Sheet was updated, else False.
+
   Raises:
-    Exception: If unknown error occurs while retrieving data from the Time
-    Managed Sheet.
+    Exception: If unknown error occurs while updating the Time Managed Sheet.
   """
+  update_request_list = [get_clear_notes(time_managed_sheet_id)]
+  update_request_list += get_update_error_notes(update_errors,
+                                                time_managed_sheet_id)
+  update_request_list += get_delete_rows(delete_assets, time_managed_sheet_id)
+
   try:
-    sheets_service.clear_sheet_range(f'Time Managed!J2:L')
+    sheets_service.batch_update_requests(update_request_list)
   except Exception as e:
-    print(f'Unable to update Time Managed Sheet rows: {str(e)}')
+    _LOGGER.error('Unable to update/delete Time Managed Sheet rows: %s', e)
+    return False
+  return True
 
-  if update_errors:
-    update_error_note(sheets_service, update_errors, time_managed_sheet_id)
 
-  if delete_assets:
-    delete_row_by_index(sheets_service, delete_assets, time_managed_sheet_id)
+def get_updated_time_managed_rows(time_managed_rows, update_errors,
+                                  delete_assets):
+  """Applies the Time Managed Sheet update to rows read before it.
 
+  Mirrors update_time_managed_sheet: the notes are cleared, the error messages
+  written and the deleted rows dropped, with the row indices of the rows
+  below them shifted up.
+
+  Args:
+    time_managed_rows: Data in Time Managed Sheet before the update.
+    update_errors: error messages written to the Time Managed Sheet.
+    delete_assets: assets deleted from the Time Managed Sheet.
+
+  Returns:
+    updated_rows: Data in Time Managed Sheet after the update.
+  """
+  error_notes = {update_row[0]: update_row[5] for update_row in update_errors}
+  deleted_indices = sorted({delete_row[0] for delete_row in delete_assets})
+  deleted_index_set = set(deleted_indices)
+
+  updated_rows = []
+  for row in time_managed_rows:
+    row_index = row['row_index']
+    if row_index in deleted_index_set:
+      continue
+    row_data = row['row'][:TimeManagedColumn.DELETE_BY_PERFORMANCE]
+    row_data += ['', '', error_notes.get(row_index, '')]
+    updated_rows.append({
+        'row_index': row_index - bisect.bisect_left(deleted_indices, row_index),
+        'row': row_data
+    })
+  return updated_rows
 
-def write_to_change_history(sheets_service, row_data, message):
-  """Write change history.
+
+def get_change_history(row_data, message):
+  """Gets a Change History row.
 
   Args:
-    sheets_service: Google sheet api service.
     row_data: target asset information.
     message: Change history message.
 
+  Returns:
+    Row to write to the Change History Sheet.
+  """
+  return row_data[:-3] + [message, str(_TODAY)]
+
+
+def write_to_change_history(sheets_service, result_logs):
+  """Write change history.
+
+  Args:
+    sheets_service: Google sheet api service.
+    result_logs: rows to write, built by get_change_history.
+
   Raises:
     Exception: If unknown error occurs while writing to the Change History
     Sheet.
   """
-  result_log = row_data[:-3].copy()
+  if not result_logs:
+    return
   try:
-    result_log.append(message)
-    result_log.append(str(_TODAY))
-    sheets_service.write_to_sheet(_CHANGE_HISTORY_SHEET_RANGE, [result_log])
+    sheets_service.write_to_sheet(_CHANGE_HISTORY_SHEET_RANGE, result_logs)
   except Exception as e:
-    print(f'Unable to update Change History Sheet: {str(e)}')
+    _LOGGER.error('Unable to update Change History Sheet: %s', e)
 
 
 def time_managed(ads_service, sheets_service, time_managed_sheet_id,
@@ -373,11 +588,15 @@ def time_managed(ads_service, sheets_service, time_managed_sheet_id,
     time_managed_rows: Data in Time Managed Sheet.
 
   Returns:
-    delete_assets: Deleted assets.
+    (delete_assets, updated_rows): Deleted assets, and the Time Managed rows as
+    they are in the sheet after the update. updated_rows is None if the sheet
+    could not be updated.
   """
   delete_assets = []
   update_errors = []
-  today = _TODAY.date()
+  pending_rows = []
+  pending_deletes = []
+  today = _TODAY_DATE
 
   for row in time_managed_rows:
     row_index = row['row_index']
@@ -391,7 +610,7 @@ def time_managed(ads_service, sheets_service, time_managed_sheet_id,
     delete_by_performance = row_data[TimeManagedColumn.DELETE_BY_PERFORMANCE]
     error_message = ''
 
-    if asset_type not in ['HEADLINE', 'DESCRIPTION', 'IMAGE', 'VIDEO']:
+    if asset_type not in _ASSET_TYPE_NOUNS:
       error_message = f'Please check the creative type'
       update_errors.append([
           row_index, customer_id, ad_group_id, asset_id, asset_type,
@@ -405,19 +624,9 @@ def time_managed(ads_service, sheets_service, time_managed_sheet_id,
       if check_result:
         end_date = date_result
         if end_date <= today:
-          delete_result, error_message = remove_asset(ads_service, customer_id,
-                                                      ad_group_id, asset_id,
-                                                      asset_type)
-          if delete_result:
-            delete_assets.append(
-                [row_index, customer_id, ad_group_id, asset_id, asset_type])
-            write_to_change_history(sheets_service, row_data,
-                                    'Creative successfully removed')
-          else:
-            update_errors.append([
-                row_index, customer_id, ad_group_id, asset_id, asset_type,
-                error_message
-            ])
+          pending_rows.append(row)
+          pending_deletes.append(
+              (customer_id, ad_group_id, asset_id, asset_type))
           continue
       else:
         update_errors.append([
@@ -426,30 +635,44 @@ def time_managed(ads_service, sheets_service, time_managed_sheet_id,
         ])
 
     # Delete low performance assets.
-    if perf_note in ['LOW', 'NO RECENT RECORDS'
-                    ] and delete_by_performance == 'TRUE':
-      delete_result, error_message = remove_asset(ads_service, customer_id,
-                                                  ad_group_id, asset_id,
-                                                  asset_type)
-      if delete_result:
-        delete_assets.append(
-            [row_index, customer_id, ad_group_id, asset_id, asset_type])
-        write_to_change_history(sheets_service, row_data,
-                                'Creative successfully removed')
-      else:
-        update_errors.append([
-            row_index, customer_id, ad_group_id, asset_id, asset_type,
-            error_message
-        ])
+    if (perf_note in _PERFORMANCE_NOTES_TO_DELETE and
+        delete_by_performance == 'TRUE'):
+      pending_rows.append(row)
+      pending_deletes.append((customer_id, ad_group_id, asset_id, asset_type))
+
+  # Remove the queued assets with one mutate per ad.
+  ad_group_info = prefetch_ad_group_info(
+      ads_service, ((customer_id, ad_group_id)
+                    for customer_id, ad_group_id, _, _ in pending_deletes))
+  delete_results = remove_assets(ads_service, pending_deletes, ad_group_info)
+  change_history = []
+  for row, pending_delete, (delete_result, error_message) in zip(
+      pending_rows, pending_deletes, delete_results):
+    (customer_id, ad_group_id, asset_id, asset_type) = pending_delete
+    if delete_result:
+      delete_assets.append(
+          [row['row_index'], customer_id, ad_group_id, asset_id, asset_type])
+      change_history.append(
+          get_change_history(row['row'], 'Creative successfully removed'))
+    else:
+      update_errors.append([
+          row['row_index'], customer_id, ad_group_id, asset_id, asset_type,
+          error_message
+      ])
+
+  write_to_change_history(sheets_service, change_history)
 
   # Update Time Managed Sheet. (Delete rows & write error message)
-  update_time_managed_sheet(sheets_service, update_errors,
-                            time_managed_sheet_id, delete_assets)
+  updated_rows = None
+  if update_time_managed_sheet(sheets_service, update_errors,
+                               time_managed_sheet_id, delete_assets):
+    updated_rows = get_updated_time_managed_rows(time_managed_rows,
+                                                 update_errors, delete_assets)
 
-  return delete_assets
+  return delete_assets, updated_rows
 
 
-def check_ad_type(ads_service, customer_id, ad_group_id):
+def check_ad_type(ads_service, customer_id, ad_group_id, ad_group_info=None):
   """Check the ad type.
 
   If it's ACe, return false since Google Ads API currently don't support
@@ -459,6 +682,7 @@ def check_ad_type(ads_service, customer_id, ad_group_id):
     ads_service: Google Ads API service.
     customer_id: Google ads customer id.
     ad_group_id: Ad group id.
+    ad_group_info: optional result of prefetch_ad_group_info.
 
   Returns:
     execution result.
@@ -469,17 +693,16 @@ def check_ad_type(ads_service, customer_id, ad_group_id):
     Exception: If unknown error occurs.
   """
   try:
-    (_, ad_type) = ads_service._get_ad_and_ad_type(customer_id, ad_group_id)
+    (_, ad_type) = get_ad_and_ad_type(ads_service, customer_id, ad_group_id,
+                                      ad_group_info)
   except googleads.errors.GoogleAdsException as failures:
-    error_message = ''
-    for error in failures.failure.errors:
-      error_message += ads_api_error_translation.translate_ads_api_errors(
-          error.message)
+    error_message = ads_api_error_translation.get_error_message(
+        failures.failure.errors)
     return False, error_message
   except Exception as e:
     return False, repr(e)
 
-  if ad_type == ads_service._google_ads_client.enums.AdTypeEnum.APP_ENGAGEMENT_AD:
+  if ad_type == ads_service._app_engagement_ad_type:
     error_message = f'Performance reporting not supported for ACe Campaigns.'
     return False, error_message
 
@@ -505,7 +728,7 @@ def check_minimum_days_elapsed(start_date, active_days):
   check_result, check_date_result = check_date_format(start_date)
 
   if check_result:
-    served_days = (_TODAY.date() - check_date_result).days
+    served_days = (_TODAY_DATE - check_date_result).days
   else:
     error_message = check_date_result
     return check_result, error_message
@@ -517,8 +740,62 @@ def check_minimum_days_elapsed(start_date, active_days):
   return True, ''
 
 
+def prefetch_asset_perf(ads_service, perf_rows, duration):
+  """Retrieves asset performance of many assets via Google Ads API in bulk.
+
+  Assets are queried with one GAQL query per customer and asset type instead of
+  one per asset, and those queries run concurrently. Rows with an unknown
+  creative type or a non-numeric ad group id are left out, so they cannot fail
+  the query of the other rows. If the query of a customer fails, its assets
+  are left out too. Left out assets are looked up one by one later, which
+  reports the error per row.
+
+  Args:
+    ads_service: Google Ads API service.
+    perf_rows: iterable of (customer_id, ad_group_id, asset_id, asset_type)
+      tuples.
+    duration: duration to evaluate the performance.
+
+  Returns:
+    asset_perf_results: A dictionary where key is a (customer_id, ad_group_id,
+    asset_id, asset_type) tuple and value is the asset performance.
+  """
+  asset_ids_by_customer = collections.defaultdict(
+      lambda: collections.defaultdict(list))
+  for customer_id, ad_group_id, asset_id, asset_type in perf_rows:
+    if asset_type not in _ASSET_TYPE_NOUNS or not ad_group_id.isdigit():
+      continue
+    asset_ids_by_customer[(customer_id, asset_type)][ad_group_id].append(
+        asset_id)
+
+  asset_perf_results = {}
+  with futures.ThreadPoolExecutor(
+      max_workers=_MAX_CUSTOMER_WORKERS) as executor:
+    customer_futures = {
+        (customer_id, asset_type): executor.submit(
+            ads_service._get_asset_performance_by_ad_group_list, customer_id,
+            asset_ids_by_ad_group, asset_type, duration)
+        for (customer_id, asset_type), asset_ids_by_ad_group in (
+            asset_ids_by_customer.items())
+    }
+
+  for (customer_id, asset_type), customer_future in customer_futures.items():
+    try:
+      results = customer_future.result()
+    except _PREFETCH_ERRORS as e:
+      _LOGGER.warning(
+          'Unable to prefetch %s performance of customer %s, looking the '
+          'assets up one by one: %r', asset_type, customer_id, e)
+      continue
+    for (ad_group_id, asset_id), asset_perf in results.items():
+      asset_perf_results[(customer_id, ad_group_id, asset_id,
+                          asset_type)] = asset_perf
+
+  return asset_perf_results
+
+
 def get_asset_perf(ads_service, customer_id, ad_group_id, asset_id, asset_type,
-                   duration):
+                   duration, asset_perf_results=None):
   """Retrieve asset performance via Google Ads API.
 
   Args:
@@ -528,6 +805,7 @@ def get_asset_perf(ads_service, customer_id, ad_group_id, asset_id, asset_type,
     asset_id: For text assets, text itself. For media assets, asset id.
     asset_type: Asset type.
     duration: duration to evaluate the performance.
+    asset_perf_results: optional result of prefetch_asset_perf.
 
   Returns:
     execution result.
@@ -537,14 +815,16 @@ def get_asset_perf(ads_service, customer_id, ad_group_id, asset_id, asset_type,
     GoogleAdsException: If Google Ads API error occurs.
     Exception: If unknown error occurs.
   """
+  perf_key = (customer_id, ad_group_id, asset_id, asset_type)
+  if asset_perf_results and perf_key in asset_perf_results:
+    return True, asset_perf_results[perf_key]
+
   try:
     result = ads_service._get_asset_performance_by_metrics(
         customer_id, ad_group_id, asset_id, asset_type, duration)
   except googleads.errors.GoogleAdsException as failures:
-    result = ''
-    for error in failures.failure.errors:
-      result += ads_api_error_translation.translate_ads_api_errors(
-          error.message)
+    result = ads_api_error_translation.get_error_message(
+        failures.failure.errors)
     return False, result
   except Exception:
     return False, 'Unknown error occured while retrieving asset performance'
@@ -564,46 +844,47 @@ def evaluate_asset_perf(asset_perf, metrics):
   """
   if not asset_perf:
     return 'NO RECENT RECORDS'
-  performance_label = asset_perf[0]['performance_label']
+  performance_label = asset_perf[0].performance_label
   if performance_label != 'LOW':
     return ''
 
-  delete_flag = False
-  if metrics['impressions'] != '':
-    perf_impressions = int(asset_perf[0]['impressions'])
-    if perf_impressions < metrics['impressions']:
-      delete_flag = True
-    else:
-      delete_flag = False
-  if metrics['conversions'] != '':
-    perf_conversions = int(asset_perf[0]['conversions'])
-    if perf_conversions < metrics['conversions']:
-      delete_flag = True
-    else:
-      delete_flag = False
-  if metrics['conversions_value'] != '':
-    perf_conv_value = float(asset_perf[0]['conversions_value'])
-    if perf_conv_value < metrics['conversions_value']:
-      delete_flag = True
-    else:
-      delete_flag = False
-  if metrics['ctr'] != '':
-    perf_ctr = float(asset_perf[0]['ctr'])
-    if perf_ctr < metrics['ctr']:
-      delete_flag = True
-    else:
-      delete_flag = False
-  if metrics['clicks'] != '':
-    perf_clicks = int(asset_perf[0]['clicks'])
-    if perf_clicks < metrics['clicks']:
-      delete_flag = True
-    else:
-      delete_flag = False
+  # The asset is LOW as soon as one of the filled in metrics is below its
+  # threshold.
+  for metric, convert in _PERFORMANCE_METRICS:
+    threshold = metrics[metric]
+    if threshold != '' and convert(getattr(asset_perf[0], metric)) < threshold:
+      return 'LOW'
 
-  if delete_flag:
-    return 'LOW'
-  else:
-    return ''
+  return ''
+
+
+def _get_update_cell(time_managed_sheet_id, update_index, column_index,
+                     cell_value, fields):
+  """Gets an updateCells request for one cell in the Time Managed Sheet.
+
+  Args:
+    time_managed_sheet_id: Sheet id for the Time Managed Sheet.
+    update_index: row index of the target cell.
+    column_index: column index of the target cell.
+    cell_value: CellData of the target cell.
+    fields: CellData fields to update.
+
+  Returns:
+    cell information for updating the cell.
+  """
+  return {
+      'updateCells': {
+          'start': {
+              'sheetId': time_managed_sheet_id,
+              'rowIndex': update_index - 1,
+              'columnIndex': column_index
+          },
+          'rows': [{
+              'values': [cell_value]
+          }],
+          'fields': fields
+      }
+  }
 
 
 def get_update_checkbox(update_row, update_index, time_managed_sheet_id):
@@ -618,44 +899,23 @@ def get_update_checkbox(update_row, update_index, time_managed_sheet_id):
     update_checkbox: cell information for updating checkbox.
   """
   if update_row[5] != '':
-    update_checkbox = {
-        'updateCells': {
-            'start': {
-                'sheetId': time_managed_sheet_id,
-                'rowIndex': update_index - 1,
-                'columnIndex': TimeManagedColumn.DELETE_BY_PERFORMANCE
-            },
-            'rows': [{
-                'values': [{
-                    'dataValidation': {
-                        'condition': {
-                            'type': 'BOOLEAN'
-                        }
-                    }
-                }]
-            }],
-            'fields': 'dataValidation'
-        }
-    }
+    update_checkbox = _get_update_cell(
+        time_managed_sheet_id, update_index,
+        TimeManagedColumn.DELETE_BY_PERFORMANCE,
+        {'dataValidation': {
+            'condition': {
+                'type': 'BOOLEAN'
+            }
+        }}, 'dataValidation')
   else:
-    update_checkbox = {
-        'updateCells': {
-            'start': {
-                'sheetId': time_managed_sheet_id,
-                'rowIndex': update_index - 1,
-                'columnIndex': TimeManagedColumn.DELETE_BY_PERFORMANCE
+    update_checkbox = _get_update_cell(
+        time_managed_sheet_id, update_index,
+        TimeManagedColumn.DELETE_BY_PERFORMANCE, {
+            'userEnteredValue': {
+                'stringValue': update_row[5]
             },
-            'rows': [{
-                'values': [{
-                    'userEnteredValue': {
-                        'stringValue': update_row[5]
-                    },
-                    'dataValidation': None
-                }]
-            }],
-            'fields': 'userEnteredValue, dataValidation'
-        }
-    }
+            'dataValidation': None
+        }, 'userEnteredValue, dataValidation')
   return update_checkbox
 
 
@@ -670,23 +930,11 @@ def get_update_perf_note(update_row, update_index, time_managed_sheet_id):
   Returns:
     update_perf_note: cell information for updating performance note.
   """
-  update_perf_note = {
-      'updateCells': {
-          'start': {
-              'sheetId': time_managed_sheet_id,
-              'rowIndex': update_index - 1,
-              'columnIndex': TimeManagedColumn.PERFORMANCE
-          },
-          'rows': [{
-              'values': [{
-                  'userEnteredValue': {
-                      'stringValue': update_row[5]
-                  }
-              }]
-          }],
-          'fields': 'userEnteredValue'
-      }
-  }
+  update_perf_note = _get_update_cell(
+      time_managed_sheet_id, update_index, TimeManagedColumn.PERFORMANCE,
+      {'userEnteredValue': {
+          'stringValue': update_row[5]
+      }}, 'userEnteredValue')
   return update_perf_note
 
 
@@ -701,23 +949,11 @@ def get_update_error_note(update_row, update_index, time_managed_sheet_id):
   Returns:
     update_error_note: cell information for updating error note.
   """
-  update_error_note = {
-      'updateCells': {
-          'start': {
-              'sheetId': time_managed_sheet_id,
-              'rowIndex': update_index - 1,
-              'columnIndex': TimeManagedColumn.ERROR_NOTE
-          },
-          'rows': [{
-              'values': [{
-                  'userEnteredValue': {
-                      'stringValue': update_row[5]
-                  }
-              }]
-          }],
-          'fields': 'userEnteredValue'
-      }
-  }
+  update_error_note = _get_update_cell(
+      time_managed_sheet_id, update_index, TimeManagedColumn.ERROR_NOTE,
+      {'userEnteredValue': {
+          'stringValue': update_row[5]
+      }}, 'userEnteredValue')
   return update_error_note
 
 
@@ -750,31 +986,20 @@ def update_time_managed_sheet_perf_note(sheets_service, time_managed_sheet_id,
       update_checkbox_list.append(update_checkbox)
 
   if update_errors:
-    for update_row in update_errors:
-      update_index = update_row[0]
-      update_error_note = get_update_error_note(update_row, update_index,
-                                                time_managed_sheet_id)
-      update_value_request_list.append(update_error_note)
-
-  if update_value_request_list:
-    try:
-      # Update Perf Note / Error Note
-      sheets_service.batch_update_requests(update_value_request_list)
-
-    except Exception as e:
-      print(
-          f'Error while updating performance note in the Time Managed Sheet: {str(e)}'
-      )
+    update_value_request_list += get_update_error_notes(update_errors,
+                                                        time_managed_sheet_id)
 
-  if update_checkbox_list:
+  # Perf Note / Error Note updates and the Delete by Performance checkboxes
+  # touch different cells, so they are sent in one batch.
+  update_request_list = update_value_request_list + update_checkbox_list
+  if update_request_list:
     try:
-      # Update Delete by Performance column (insert checkbox)
-      sheets_service.batch_update_requests(update_checkbox_list)
+      sheets_service.batch_update_requests(update_request_list)
 
     except Exception as e:
-      print(
-          f'Error while updating performance note in the Time Managed Sheet: {str(e)}'
-      )
+      _LOGGER.error(
+          'Error while updating performance note in the Time Managed Sheet: %s',
+          e)
 
 
 def performance_managed(ads_service, sheets_service, conditions,
@@ -810,6 +1035,14 @@ def performance_managed(ads_service, sheets_service, conditions,
       'clicks': conditions[PerformanceCondition.CLICKS]
   }
 
+  ad_group_info = prefetch_ad_group_info(
+      ads_service, ((str(row['row'][TimeManagedColumn.CUSTOMER_ID]),
+                     str(row['row'][TimeManagedColumn.AD_GROUP_ID]))
+                    for row in time_managed_rows
+                    if str(row['row'][TimeManagedColumn.CREATIVE_TYPE]).upper()
+                    in _ASSET_TYPE_NOUNS))
+
+  perf_rows = []
   for row in time_managed_rows:
     row_index = row['row_index']
     row_data = row['row']
@@ -822,11 +1055,11 @@ def performance_managed(ads_service, sheets_service, conditions,
     current_error_note = str(row_data[TimeManagedColumn.ERROR_NOTE])
     error_message = ''
 
-    if asset_type not in ['HEADLINE', 'DESCRIPTION', 'IMAGE', 'VIDEO']:
+    if asset_type not in _ASSET_TYPE_NOUNS:
       continue
 
     ad_type_result, error_message = check_ad_type(ads_service, customer_id,
-                                                  ad_group_id)
+                                                  ad_group_id, ad_group_info)
     if not ad_type_result:
       if current_error_note:
         error_message = f'{current_error_note} / {error_message}'
@@ -847,9 +1080,17 @@ def performance_managed(ads_service, sheets_service, conditions,
       ])
       continue
 
+    perf_rows.append((row_index, customer_id, ad_group_id, asset_id,
+                      asset_type, current_perf_note, current_error_note))
+
+  asset_perf_results = prefetch_asset_perf(
+      ads_service, (perf_row[1:5] for perf_row in perf_rows), duration)
+
+  for (row_index, customer_id, ad_group_id, asset_id, asset_type,
+       current_perf_note, current_error_note) in perf_rows:
     perf_result, asset_perf = get_asset_perf(ads_service, customer_id,
                                              ad_group_id, asset_id, asset_type,
-                                             duration)
+                                             duration, asset_perf_results)
     if perf_result:
       new_perf_note = evaluate_asset_perf(asset_perf, metrics)
       if not current_perf_note and new_perf_note == '':
@@ -874,11 +1115,13 @@ def performance_managed(ads_service, sheets_service, conditions,
   return update_perf_note_assets
 
 
-def get_time_managed_rows(sheets_service):
+def get_time_managed_rows(sheets_service, time_managed_sheet=None):
   """Gets the rows from the "Time Managed" sheet.
 
   Args:
     sheets_service: Google Sheet APIs service.
+    time_managed_sheet: values of the Time Managed Sheet read ahead of time.
+      Read from the sheet if not given.
 
   Returns:
     time_managed_rows: An array of arrays. Each subarray contains the asset
@@ -890,32 +1133,29 @@ def get_time_managed_rows(sheets_service):
     Exception: If unknown error occurs while retrieving data from the Time
     Managed Sheet.
   """
+  time_managed_rows = []
   try:
-    time_managed_sheet = sheets_service.get_spreadsheet_values(
-        _TIME_MANAGED_SHEET_RANGE)
+    if time_managed_sheet is None:
+      time_managed_sheet = sheets_service.get_spreadsheet_values(
+          _TIME_MANAGED_SHEET_RANGE)
 
-    time_managed_rows = []
-    for row_index, row_data in enumerate(time_managed_sheet):
+    customer_id_column = int(TimeManagedColumn.CUSTOMER_ID)
+    for row_index, row_data in enumerate(time_managed_sheet, start=2):
       # Fill in the empty columns
       if len(row_data) < _NUMBER_OF_TIME_MANAGED_SHEET_COLUMNS:
-        for _ in range(_NUMBER_OF_TIME_MANAGED_SHEET_COLUMNS - len(row_data)):
-          row_data.append('')
+        row_data.extend([''] *
+                        (_NUMBER_OF_TIME_MANAGED_SHEET_COLUMNS - len(row_data)))
       # Must have CustomerId, AdGroupId, AssetId, MediaType, Start Date in the
       # row. Else Skip the rows.
-      if row_data[TimeManagedColumn.CUSTOMER_ID] and \
-              row_data[TimeManagedColumn.AD_GROUP_ID] and \
-              row_data[TimeManagedColumn.ASSET_ID_OR_TEXT] and \
-              row_data[TimeManagedColumn.CREATIVE_TYPE] and \
-              row_data[TimeManagedColumn.START_DATE]:
-        row_data[TimeManagedColumn.CUSTOMER_ID] = (
-            row_data[TimeManagedColumn.CUSTOMER_ID].replace('-', '')).replace(
-                ' ', '')
-        time_managed_rows.append({'row_index': row_index + 2, 'row': row_data})
+      if all(_get_required_time_managed_values(row_data)):
+        row_data[customer_id_column] = row_data[customer_id_column].translate(
+            _CUSTOMER_ID_TABLE)
+        time_managed_rows.append({'row_index': row_index, 'row': row_data})
   except HttpError:
-    print('Unable to read the Time Managed sheet. '
-          'Verify whether the id/name is correct.')
+    _LOGGER.error('Unable to read the Time Managed sheet. '
+                  'Verify whether the id/name is correct.')
   except Exception as e:
-    print('Unable to read the Time Managed sheet.', repr(e))
+    _LOGGER.error('Unable to read the Time Managed sheet. %r', e)
 
   return time_managed_rows
 
@@ -929,107 +1169,63 @@ def convert_to_string(val):
   Returns:
     string without white space.
   """
-  return str(val).replace(' ', '')
-
-
-def convert_to_int(val):
-  """Convert value to integer after removing white space.
-
-  Args:
-    val: value to convert.
-
-  Returns:
-    integer.
-  """
-  return int(str(val).replace(' ', ''))
-
-
-def convert_to_float(val):
-  """Convert value to float after removing white space.
-
-  Args:
-    val: value to convert.
-
-  Returns:
-    float.
-  """
-  return float(str(val).replace(' ', ''))
+  return str(val).translate(_WHITE_SPACE_TABLE)
 
 
+@functools.lru_cache(maxsize=128)
 def check_performance_condition_value(conditions):
   """Check the correctness of the values in the Performance Condition Sheet.
 
+  Results are cached, as spreadsheets often share the same conditions.
+
   Args:
-    conditions: conditions in the Performance Condition Sheet.
+    conditions: tuple of conditions in the Performance Condition Sheet.
 
   Returns:
-    conditions: conditions in the correct data type.
+    conditions: tuple of conditions in the correct data type.
 
   Raises:
     ValueError: If value is not in the correct format.
   """
-  active_days = convert_to_string(conditions[PerformanceCondition.ACTIVE_DAYS])
-  duration = convert_to_string(conditions[PerformanceCondition.DURATION])
-  impressions = convert_to_string(conditions[PerformanceCondition.IMPRESSIONS])
-  conversions = convert_to_string(conditions[PerformanceCondition.CONVERSIONS])
-  conversion_value = convert_to_string(
-      conditions[PerformanceCondition.CONVERSIONS_VALUE])
-  ctr = convert_to_string(conditions[PerformanceCondition.CTR])
-  clicks = convert_to_string(conditions[PerformanceCondition.CLICKS])
-
-  if active_days == '':
+  (active_days, duration, impressions, conversions, conversions_value, ctr,
+   clicks) = map(convert_to_string, _get_performance_conditions(conditions))
+
+  if not active_days:
     raise ValueError(
         'Minimum days elapsed from the creative upload date is empty.')
-  else:
-    conditions[PerformanceCondition.ACTIVE_DAYS] = convert_to_int(
-        conditions[PerformanceCondition.ACTIVE_DAYS])
+  active_days = int(active_days)
 
-  if duration == '':
+  if not duration:
     raise ValueError('Evaluate duration of last N(Duration) days is empty.')
-  else:
-    conditions[PerformanceCondition.DURATION] = convert_to_int(
-        conditions[PerformanceCondition.DURATION])
+  duration = int(duration)
 
-  if duration == '0':
+  if duration <= 0:
     raise ValueError(
         'Evaluate duration of last N(Duration) days should be greater than 0.')
-  else:
-    conditions[PerformanceCondition.DURATION] = convert_to_int(
-        conditions[PerformanceCondition.DURATION])
 
-  metrics = [metric for metric in conditions[2:] if metric != '']
-  if not metrics:
+  metrics = ((impressions, int), (conversions, int), (conversions_value, float),
+             (ctr, float), (clicks, int))
+  if not any(value for value, _ in metrics):
     raise ValueError(
         'Performance evaluation metrics are all empty. Please fill in at least one metric.'
     )
 
-  if not impressions == '':
-    conditions[PerformanceCondition.IMPRESSIONS] = convert_to_int(
-        conditions[PerformanceCondition.IMPRESSIONS])
-  if not conversions == '':
-    conditions[PerformanceCondition.CONVERSIONS] = convert_to_int(
-        conditions[PerformanceCondition.CONVERSIONS])
-  if not conversion_value == '':
-    conditions[PerformanceCondition.CONVERSIONS_VALUE] = convert_to_float(
-        conditions[PerformanceCondition.CONVERSIONS_VALUE])
-  if not ctr == '':
-    conditions[PerformanceCondition.CTR] = convert_to_float(
-        conditions[PerformanceCondition.CTR])
-  if not clicks == '':
-    conditions[PerformanceCondition.CLICKS] = convert_to_int(
-        conditions[PerformanceCondition.CLICKS])
-
-  return conditions
+  return (active_days, duration) + tuple(
+      convert(value) if value else '' for value, convert in metrics)
 
 
-def get_performance_conditions_rows(sheets_service):
+def get_performance_conditions_rows(sheets_service,
+                                    performance_condition_sheet=None):
   """Gets the rows from the "Performance Conditions" sheet.
 
   Args:
     sheets_service: Google Sheet APIs service.
+    performance_condition_sheet: values of the Performance Condition Sheet
+      read ahead of time. Read from the sheet if not given.
 
   Returns:
-    conditions: An array that contains conditions for asset performance.
+    conditions: A tuple that contains conditions for asset performance, or an
+    empty list if the conditions could not be read.
 
   Raises:
     HttpError: Unable to read the Performance Condition sheet due to wrong sheet
@@ -1039,31 +1235,30 @@ def get_performance_conditions_rows(sheets_service):
   """
   conditions = []
   try:
-    performance_condition_sheet = sheets_service.get_spreadsheet_values(
-        _PERFORMANCE_CONDITION_SHEET_RANGE)
+    if performance_condition_sheet is None:
+      performance_condition_sheet = sheets_service.get_spreadsheet_values(
+          _PERFORMANCE_CONDITION_SHEET_RANGE)
 
     if len(performance_condition_sheet) == 0:
       raise Exception(
           'Skipping the performance evaluation: Performance condition Sheet is empty.'
       )
     else:
-      for val in performance_condition_sheet:
-        if val:
-          conditions.append(val[0])
-        else:
-          conditions.append('')
+      sheet_conditions = [
+          val[0] if val else '' for val in performance_condition_sheet
+      ]
 
-      if len(conditions) < _NUMBER_OF_PERFORMANCE_CONDITIONS:
-        for _ in range(_NUMBER_OF_PERFORMANCE_CONDITIONS - len(conditions)):
-          conditions.append('')
+      if len(sheet_conditions) < _NUMBER_OF_PERFORMANCE_CONDITIONS:
+        sheet_conditions.extend(
+            [''] * (_NUMBER_OF_PERFORMANCE_CONDITIONS - len(sheet_conditions)))
 
-      conditions = check_performance_condition_value(conditions)
+      conditions = check_performance_condition_value(tuple(sheet_conditions))
 
   except HttpError:
-    print('Unable to read the Performance Condition sheet. '
-          'Verify whether the sheet id/name is correct.')
+    _LOGGER.error('Unable to read the Performance Condition sheet. '
+                  'Verify whether the sheet id/name is correct.')
   except Exception as e:
-    print(repr(e))
+    _LOGGER.error('%r', e)
 
   return conditions
 
@@ -1084,10 +1279,76 @@ def get_time_manged_sheet_id(sheets_service):
     time_managed_sheet_id = sheets_service.get_sheet_id_by_name(
         _TIME_MANAGE_SHEET_NAME)
   except Exception as e:
-    print(f'Error while retrieving the Time Managed Sheet ID: {str(e)}')
+    _LOGGER.error('Error while retrieving the Time Managed Sheet ID: %s', e)
   return time_managed_sheet_id
 
 
+def get_sheet_values(sheets_service):
+  """Reads the Time Managed and Performance Condition Sheets in one request.
+
+  Args:
+    sheets_service: Google Sheet APIs service.
+
+  Returns:
+    (time_managed_sheet, performance_condition_sheet): values of the two
+    sheets, or (None, None) if the request fails so that each sheet is read
+    and reported on separately.
+  """
+  try:
+    return tuple(
+        sheets_service.batch_get_spreadsheet_values(
+            [_TIME_MANAGED_SHEET_RANGE, _PERFORMANCE_CONDITION_SHEET_RANGE]))
+  except HttpError as e:
+    _LOGGER.warning(
+        'Unable to read the Time Managed and Performance Condition Sheets in '
+        'one request, reading them one by one: %r', e)
+    return None, None
+
+
+def remove_spreadsheet_assets(credential, ads_service, spreadsheet_id):
+  """Runs the time and performance managed deletions of one spreadsheet.
+
+  Args:
+    credential: credentials for the Google Sheets API.
+    ads_service: Google ads api service.
+    spreadsheet_id: creative mango Google sheets Id.
+  """
+  sheets_service = sheets_api.SheetsService(credential, spreadsheet_id)
+  time_managed_sheet_id = get_time_manged_sheet_id(sheets_service)
+
+  time_managed_sheet, performance_condition_sheet = get_sheet_values(
+      sheets_service)
+
+  time_managed_rows = get_time_managed_rows(sheets_service,
+                                            time_managed_sheet)
+  delete_assets, new_time_managed_rows = time_managed(ads_service,
+                                                     sheets_service,
+                                                     time_managed_sheet_id,
+                                                     time_managed_rows)
+
+  if delete_assets:
+    _LOGGER.info('%s: Successfully deleted assets: %s', spreadsheet_id,
+                 delete_assets)
+  else:
+    _LOGGER.info('%s: No assets to delete', spreadsheet_id)
+
+  conditions = get_performance_conditions_rows(sheets_service,
+                                               performance_condition_sheet)
+  if conditions:
+    if new_time_managed_rows is None:
+      new_time_managed_rows = get_time_managed_rows(sheets_service)
+    update_perf_note_assets = performance_managed(ads_service, sheets_service,
+                                                  conditions,
+                                                  time_managed_sheet_id,
+                                                  new_time_managed_rows)
+    if update_perf_note_assets:
+      _LOGGER.info(
+          '%s: Successfully updated Performance Note for low performing '
+          'assets: %s', spreadsheet_id, update_perf_note_assets)
+  else:
+    _LOGGER.info('%s: No low performing assets to update', spreadsheet_id)
+
+
 def remover_main(spreadsheet_ids, service_account, client_secret, ads_account):
   """Main function for creative_remover.py.
 
@@ -1103,35 +1364,14 @@ def remover_main(spreadsheet_ids, service_account, client_secret, ads_account):
   credential = auth.get_credentials_from_file(service_account_file=service_account, client_secret_file=client_secret)
   ads_service = ads_service_api.AdService(ads_account)
 
+  # Spreadsheets are processed one at a time: removals rewrite the whole asset
+  # list of an ad, so spreadsheets sharing an ad group must not interleave.
   for spreadsheet_id in spreadsheet_ids:
-    sheets_service = sheets_api.SheetsService(credential, spreadsheet_id)
-    time_managed_sheet_id = get_time_manged_sheet_id(sheets_service)
-
-    time_managed_rows = get_time_managed_rows(sheets_service)
-    delete_assets = time_managed(ads_service, sheets_service,
-                                 time_managed_sheet_id, time_managed_rows)
-
-    if delete_assets:
-      print(f'Successfully deleted assets: {delete_assets}')
-    else:
-      print('No assets to delete')
-
-    conditions = get_performance_conditions_rows(sheets_service)
-    if conditions:
-      new_time_managed_rows = get_time_managed_rows(sheets_service)
-      update_perf_note_assets = performance_managed(ads_service, sheets_service,
-                                                    conditions,
-                                                    time_managed_sheet_id,
-                                                    new_time_managed_rows)
-      if update_perf_note_assets:
-        print(
-            'Successfully updated Performance Note for low performing assets: '
-            f'{update_perf_note_assets}')
-    else:
-      print('No low performing assets to update')
+    remove_spreadsheet_assets(credential, ads_service, spreadsheet_id)
 
 
 if __name__ == '__main__':
+  logging.basicConfig(level=logging.INFO, format='%(message)s')
   with open('config/setup.yaml', 'r') as ymlfile:
     cfg = yaml.safe_load(ymlfile)
 
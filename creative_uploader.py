@@ -620,10 +620,8 @@ def process_asset_row(ads_service, drive_service, sheets_service, uploading_row,
       process_asset_row_removal(ads_service, drive_service, uploading_row,
                                 matched_campaign)
     except googleads.errors.GoogleAdsException as failures:
-      errors_result = ''
-      for error in failures.failure.errors:
-        errors_result += ads_api_error_translation.translate_ads_api_errors(
-            error.message)
+      errors_result = ads_api_error_translation.get_error_message(
+          failures.failure.errors)
       result_log = add_log_message(
           uploading_row, matched_campaign,
           'Unable to remove the asset. Errors: ' + errors_result)
@@ -646,10 +644,8 @@ def process_asset_row(ads_service, drive_service, sheets_service, uploading_row,
                                      'Action succeed.', resource_name)
         success_campaigns.append(matched_campaign[1])
       except googleads.errors.GoogleAdsException as failures:
-        errors_result = ''
-        for error in failures.failure.errors:
-          errors_result += ads_api_error_translation.translate_ads_api_errors(
-              error.message)
+        errors_result = ads_api_error_translation.get_error_message(
+            failures.failure.errors)
         result_log = add_log_message(
             uploading_row, matched_campaign,
             'Unable to upload the asset. Errors: ' + errors_result)
@@ -923,8 +919,7 @@ def format_uploading_sheet_value(uploading_sheet_rows):
     for upload.
   """
   result_uploading_rows = []
-  for index in range(len(uploading_sheet_rows)):
-    uploading_row = uploading_sheet_rows[index]
+  for row_index, uploading_row in enumerate(uploading_sheet_rows, start=2):
     if len(uploading_row) == 0:
       continue
     if uploading_row[UploadColumnMap.ADGROUP_ALIAS]:
@@ -942,7 +937,7 @@ def format_uploading_sheet_value(uploading_sheet_rows):
             UploadColumnMap.CREATIVE_NAME_OR_TEXT] = text_asset_auto_modify(
                 text_to_modify, asset_type)
 
-      uploading_row.append(index + 2)
+      uploading_row.append(row_index)
       result_uploading_rows.append(uploading_row)
 
   return result_uploading_rows
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Update image/video asset file urls in the Upload Sheet."""
+import logging
 from urllib import parse
 
 import auth
@@ -20,6 +21,8 @@ import sheets_api
 import yaml
 import youtube_api
 
+_LOGGER = logging.getLogger(__name__)
+
 # Upload sheet range for drive urls
 _UPLOAD_RANGE = 'Upload!A2:D'
 _YOUTUBE_URL = 'https://www.youtube.com/watch?v='
@@ -49,6 +52,8 @@ def get_file_youtube(spreadsheet_ids, credential
     new_youtube_files = youtube_service.get_youtube_urls(
         _YOUTUBE_URL, yt_ids_sheet, youtube_window)
     sheets_service.write_to_sheet(_UPLOAD_RANGE, new_youtube_files)
+    _LOGGER.info('%s: Added %d YouTube videos to the Upload Sheet',
+                 spreadsheet_id, len(new_youtube_files))
 
 
 def get_file_main(spreadsheet_ids, service_account, client_secret
@@ -96,6 +101,8 @@ def get_file_main(spreadsheet_ids, service_account, client_secret
       if file[3] not in files_in_upload_sheet:
         new_files.append(file)
     sheets_service.write_to_sheet(_UPLOAD_RANGE, new_files)
+    _LOGGER.info('%s: Added %d Drive files to the Upload Sheet', spreadsheet_id,
+                 len(new_files))
 
   if(youtube_service_enable and youtube_window):
     get_file_youtube(spreadsheet_ids, credential, youtube_secrets
@@ -103,6 +110,7 @@ def get_file_main(spreadsheet_ids, service_account, client_secret
 
 
 if __name__ == '__main__':
+  logging.basicConfig(level=logging.INFO, format='%(message)s')
   with open('config/setup.yaml', 'r') as ymlfile:
     cfg = yaml.safe_load(ymlfile)
   if 'driveFolderIds' not in cfg.keys():
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
 import datetime
 import enum
 import yaml
@@ -28,6 +29,7 @@ from googleapiclient.errors import HttpError
 _MAPPING_SHEET_NAME = 'Mapping'
 _MAPPING_SHEET_RANGE = f'{_MAPPING_SHEET_NAME}!A2:K'
 _MAPPING_SHEET_DATE_COLUMN = f'{_MAPPING_SHEET_NAME}!N1'
+_MAX_CUSTOMER_WORKERS = 8
 
 # Change this variable to True if you want the tool to automatically fill in the AdGroupAlias with AppId or campaign name.
 # Select either _DEFAULT_ALIAS_APPID(app id) or _DEFAULT_ALIAS_CAMPAIGN(campaign name) for default AdGroupAlias.
@@ -114,7 +116,8 @@ def get_customer_resource_names(ads_service):
   try:
     customer_resource_names = ads_service._list_accessible_customers()
   except googleads.errors.GoogleAdsException as failures:
-    print(get_error_message(failures.failure.errors))
+    print(ads_api_error_translation.get_error_message(
+        failures.failure.errors, ' '))
   except Exception:
     print('Unknown error occured while getting list of accessible customers')
 
@@ -138,7 +141,8 @@ def get_seed_customer_id(ads_service, customer_resource_name):
   try:
     seed_customer_id = ads_service._get_customer_id(customer_resource_name)
   except googleads.errors.GoogleAdsException as failures:
-    print(get_error_message(failures.failure.errors))
+    print(ads_api_error_translation.get_error_message(
+        failures.failure.errors, ' '))
   except Exception:
     print('Unknown error occured while getting customer id')
   return seed_customer_id
@@ -162,7 +166,8 @@ def get_child_accounts(ads_service, seed_customer_id):
   try:
     child_accounts = ads_service._get_all_child_accounts(seed_customer_id)
   except googleads.errors.GoogleAdsException as failures:
-    print(get_error_message(failures.failure.errors))
+    print(ads_api_error_translation.get_error_message(
+        failures.failure.errors, ' '))
   except Exception:
     print(
         'Unknown error occured while getting list of child account customer ids'
@@ -171,25 +176,35 @@ def get_child_accounts(ads_service, seed_customer_id):
   return child_accounts
 
 
-def get_error_message(errors):
-  """Concatenates multiple error messages into one.
-
-  And calls the ads_api_error_translation for each error translation.
+def get_customer_ad_groups(ads_service, customer_id):
+  """Get campaign and ad group info and the ads of one customer.
 
   Args:
-    errors: list of errors to be concatenated after translation.
+    ads_service: Google Ads APIs service handler.
+    customer_id: customer id.
 
   Returns:
-    error_message: Concatenated message.
+    A tuple of campaign and ad group rows and a dictionary of asset counts by
+    ad group id. None if the Google Ads API call failed.
   """
-  error_message = ''
-  error_messages = []
-  for error in errors:
-    error_messages.append(
-        ads_api_error_translation.translate_ads_api_errors(error.message))
-  error_message = ' '.join(error_messages)
+  try:
+    results = ads_service._get_campaign_ad_groups(customer_id)
+  except googleads.errors.GoogleAdsException as failures:
+    print(ads_api_error_translation.get_error_message(
+        failures.failure.errors, ' '))
+    return None
+  except Exception:
+    print(
+        f'Unknown error occured while getting campaign and ad group info of customer [{customer_id}]'
+    )
+    return None
 
-  return error_message
+  ad_group_id_list = []
+  for row in results:
+    ad_group_id_list.append(str(row.ad_group.id))
+  assetInfo = ads_service._get_ad_and_ad_type_by_ad_group_id_list(
+      customer_id, ad_group_id_list)
+  return results, assetInfo
 
 
 def get_campaign_ad_group_list(ads_service, customer_ids):
@@ -207,21 +222,19 @@ def get_campaign_ad_group_list(ads_service, customer_ids):
     Exception: If unknown error occurs.
   """
   campaign_ad_group_list = []
-  for customer_id in customer_ids:
-    try:
-      results = ads_service._get_campaign_ad_groups(customer_id)
-    except googleads.errors.GoogleAdsException as failures:
-      print(get_error_message(failures.failure.errors))
-    except Exception:
-      print(
-          f'Unknown error occured while getting campaign and ad group info of customer [{customer_id}]'
-      )
-
-    ad_group_id_list = []
-    for row in results:
-      ad_group_id_list.append(str(row.ad_group.id))
-    assetInfo = ads_service._get_ad_and_ad_type_by_ad_group_id_list(
-        customer_id, ad_group_id_list)
+  customer_ids = list(customer_ids)
+  # Customers are independent, so their queries run concurrently. AdService
+  # throttles the calls to stay within the API rate limits.
+  with futures.ThreadPoolExecutor(
+      max_workers=_MAX_CUSTOMER_WORKERS) as executor:
+    customer_ad_groups = list(
+        executor.map(get_customer_ad_groups,
+                     [ads_service] * len(customer_ids), customer_ids))
+
+  for customer_id, ad_groups in zip(customer_ids, customer_ad_groups):
+    if ad_groups is None:
+      continue
+    results, assetInfo = ad_groups
 
     for row in results:
       ad_group_id = str(row.ad_group.id)
@@ -260,7 +273,8 @@ def get_campaign_ad_group_list(ads_service, customer_ids):
             number_of_description, number_of_image, number_of_video
         ])
       except googleads.errors.GoogleAdsException as failures:
-        print(get_error_message(failures.failure.errors))
+        print(ads_api_error_translation.get_error_message(
+            failures.failure.errors, ' '))
       except Exception:
         print(
             f'Unknown error occured while getting number of assets in ad group [{ad_group_id}]'
@@ -375,15 +389,16 @@ def refresh_mapping_main(spreadsheet_ids, service_account, client_secret, ads_ac
   credential = auth.get_credentials_from_file(service_account, client_secret)
   ads_service = ads_service_api.AdService(ads_account)
 
+  login_customer_id = None
+  with open(ads_account) as file:
+    account_file = yaml.safe_load(file)
+    if 'login_customer_id' in account_file.keys():
+      login_customer_id = str(account_file['login_customer_id'])
+
   for spreadsheet_id in spreadsheet_ids:
     sheets_service = sheets_api.SheetsService(credential, spreadsheet_id)
 
     # Step 1. Get Child Customer Ids
-    login_customer_id = None
-    with open(ads_account) as file:
-      account_file = yaml.safe_load(file)
-      if 'login_customer_id' in account_file.keys():
-        login_customer_id = str(account_file['login_customer_id'])
     all_child_customer_ids = get_all_child_customer_ids(ads_service,
                                                         login_customer_id)
 
@@ -15,6 +15,11 @@
 
 from googleapiclient import discovery
 
+# Retries with exponential backoff on rate limit (429) and server (5xx)
+# errors. Only used for idempotent calls: a retried append or row deletion
+# could be applied twice.
+_NUM_RETRIES = 5
+
 
 class SheetsService():
   """Creates sheets service to read and write sheets.
@@ -22,6 +27,7 @@ class SheetsService():
   Attributes:
     _sheets_services: service that is used for making Sheets API calls.
     _spreadsheet_id: id of the spreadsheet to read from and write to.
+    _sheet_ids: sheet ids keyed by sheet name, read on first lookup.
   """
 
   def __init__(self, credentials, spreadsheet_id):
@@ -29,6 +35,7 @@ class SheetsService():
     self._sheets_service = discovery.build(
         'sheets', 'v4', credentials=credentials).spreadsheets()
     self._spreadsheet_id = spreadsheet_id
+    self._sheet_ids = None
 
   def get_spreadsheet_values(self, field_range):
     """Gets values from sheet.
@@ -42,9 +49,28 @@ class SheetsService():
     """
 
     result = self._sheets_service.values().get(
-        spreadsheetId=self._spreadsheet_id, range=field_range).execute()
+        spreadsheetId=self._spreadsheet_id, range=field_range).execute(
+            num_retries=_NUM_RETRIES)
     return result.get('values', [])
 
+  def batch_get_spreadsheet_values(self, field_ranges):
+    """Gets values from several sheet ranges in one request.
+
+    Args:
+      field_ranges: list of string representations of sheet ranges. For
+        example, ["SheetName!A:C", "OtherSheet!B2:B8"].
+
+    Returns:
+      List of arrays of arrays of values, one per range in field_ranges.
+    """
+    result = self._sheets_service.values().batchGet(
+        spreadsheetId=self._spreadsheet_id, ranges=field_ranges).execute(
+            num_retries=_NUM_RETRIES)
+    return [
+        value_range.get('values', [])
+        for value_range in result.get('valueRanges', [])
+    ]
+
   def clear_sheet_range(self, field_range):
     """Clears values in sheet by field range.
 
@@ -53,7 +79,8 @@ class SheetsService():
         "SheetName!A:C".
     """
     self._sheets_service.values().clear(
-        spreadsheetId=self._spreadsheet_id, range=field_range).execute()
+        spreadsheetId=self._spreadsheet_id, range=field_range).execute(
+            num_retries=_NUM_RETRIES)
 
   def write_to_sheet(self, field_range, values):
     """Writes data into sheet.
@@ -83,7 +110,7 @@ class SheetsService():
         spreadsheetId=self._spreadsheet_id,
         range=field_range,
         valueInputOption='RAW',
-        body=body).execute()
+        body=body).execute(num_retries=_NUM_RETRIES)
 
   def batch_update_requests(self, request_lists):
     """Batch update row with requests in target sheet.
@@ -105,9 +132,14 @@ class SheetsService():
     Returns:
       sheet_id: id of the sheet with the given name. Not a spreadsheet id.
     """
-    spreadsheet = self._sheets_service.get(
-        spreadsheetId=self._spreadsheet_id).execute()
-
-    for _sheet in spreadsheet['sheets']:
-      if _sheet['properties']['title'] == sheet_name:
-        return _sheet['properties']['sheetId']
+    if self._sheet_ids is None:
+      spreadsheet = self._sheets_service.get(
+          spreadsheetId=self._spreadsheet_id,
+          fields='sheets.properties(sheetId,title)').execute(
+              num_retries=_NUM_RETRIES)
+      self._sheet_ids = {
+          _sheet['properties']['title']: _sheet['properties']['sheetId']
+          for _sheet in spreadsheet['sheets']
+      }
+
+    return self._sheet_ids.get(sheet_name)
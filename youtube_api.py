@@ -15,6 +15,7 @@
 #!/usr/bin/python
 import datetime
 import http.client as httplib
+import logging
 import random
 import time
 
@@ -25,6 +26,7 @@ from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaInMemoryUpload
 import httplib2
 
+_LOGGER = logging.getLogger(__name__)
 
 # Explicitly tell the underlying HTTP transport library not to retry, since
 # we are handling retry logic ourselves.
@@ -63,10 +65,10 @@ _YOUTUBE_OPTIONS = {
     'keywords': '',
     'privacyStatus': 'unlisted',
 }
-_YOUTUBE_SCOPES = [
+_YOUTUBE_SCOPES = (
     'https://www.googleapis.com/auth/youtube.readonly',
     'https://www.googleapis.com/auth/youtube.upload',
-]
+)
 _YOUTUBE_TOKEN_JSON = 'config/yt_token.json'
 
 
@@ -168,11 +170,8 @@ class YTService:
 
         max_sleep = 2 * retry
         sleep_seconds = random.random() * max_sleep
-        print(
-            'YouTube sleeping {} seconds and then retrying...'.format(
-                sleep_seconds
-            )
-        )
+        _LOGGER.warning('YouTube sleeping %s seconds and then retrying...',
+                        sleep_seconds)
         time.sleep(sleep_seconds)
     return youtube_id
 